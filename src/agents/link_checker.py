@@ -4,7 +4,8 @@ import logging
 import time
 import asyncio
 import re
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from agent_framework import Executor, handler, WorkflowContext, ChatAgent, ChatMessage, Role
 from agent_framework_azure_ai import AzureAIAgentClient
 from azure.ai.agents.models import BrowserAutomationTool
@@ -19,6 +20,17 @@ from utils.exceptions import AgentExecutionError, LinkValidationError
 
 logger = logging.getLogger(__name__)
 
+# Resolved connection IDs shared across executors, keyed by (id(project_client), name)
+# and bounded as an LRU. Each entry keeps its project client, so that id() cannot be
+# reused by a new client while the entry exists, and is checked again on lookup.
+_CONNECTION_ID_CACHE_SIZE = 32
+_resolved_connection_ids: "OrderedDict[Tuple[int, str], Tuple[Any, str]]" = OrderedDict()
+
+
+def clear_connection_id_cache() -> None:
+    """Forget all resolved connection IDs, e.g. between tests."""
+    _resolved_connection_ids.clear()
+
 
 class LinkCheckerExecutor(Executor):
     """Executor for the Link Checker agent in the multi-agent workflow."""
@@ -60,10 +72,22 @@ class LinkCheckerExecutor(Executor):
             if self.project_client is None:
                 raise AgentExecutionError("project_client not provided - cannot resolve browser automation connection")
 
+            # Reuse an ID already resolved through this project client by another executor
+            cache_key = (id(self.project_client), self.browser_automation_connection_name)
+            cached = _resolved_connection_ids.get(cache_key)
+            if cached is not None and cached[0] is self.project_client:
+                _resolved_connection_ids.move_to_end(cache_key)
+                self.browser_automation_connection_id = cached[1]
+                return self.browser_automation_connection_id
+
             # Get the connection by name to retrieve its full ID
             # Note: connections.get() is async and must be awaited
             connection = await self.project_client.connections.get(self.browser_automation_connection_name)
             self.browser_automation_connection_id = connection.id
+            _resolved_connection_ids[cache_key] = (self.project_client, connection.id)
+            _resolved_connection_ids.move_to_end(cache_key)
+            if len(_resolved_connection_ids) > _CONNECTION_ID_CACHE_SIZE:
+                _resolved_connection_ids.popitem(last=False)
 
             logger.debug(f"Resolved connection ID: {self.browser_automation_connection_id}")
             return self.browser_automation_connection_id
@@ -313,6 +337,18 @@ IMPORTANT:
         """
         results = []
         
+        # The response text is the same for every URL, so scan it for
+        # indicators once rather than once per link
+        # Note: This is heuristic-based parsing. For production use, consider
+        # requesting structured JSON output from the agent for more reliable parsing.
+        result_lower = validation_result.lower()
+        # These patterns help identify link-specific issues
+        has_unreachable_indicator = any(indicator in result_lower for indicator in 
+                                        ['not accessible', 'broken', 'error', 'failed', 'inaccessible', 
+                                         'unreachable', 'not found', '404', 'invalid'])
+        has_irrelevant_indicator = any(indicator in result_lower for indicator in 
+                                       ['not relevant', 'irrelevant', 'unrelated', 'off-topic'])
+        
         # Parse the validation result to extract per-link information
         # The agent will have used browser automation to check each link
         for url in urls:
@@ -320,23 +356,12 @@ IMPORTANT:
             is_reachable = links_valid
             is_relevant = links_valid
             
-            # Try to extract specific information about this URL from the response
-            url_lower = url.lower()
-            result_lower = validation_result.lower()
-            
             # Check if the URL is specifically mentioned as problematic
-            # Note: This is heuristic-based parsing. For production use, consider
-            # requesting structured JSON output from the agent for more reliable parsing.
-            if url in validation_result or url_lower in result_lower:
-                # Look for negative indicators near the URL mention
-                # These patterns help identify link-specific issues
-                if any(indicator in result_lower for indicator in 
-                       ['not accessible', 'broken', 'error', 'failed', 'inaccessible', 
-                        'unreachable', 'not found', '404', 'invalid']):
+            if url in validation_result or url.lower() in result_lower:
+                if has_unreachable_indicator:
                     is_reachable = False
                     is_relevant = False
-                elif any(indicator in result_lower for indicator in 
-                         ['not relevant', 'irrelevant', 'unrelated', 'off-topic']):
+                elif has_irrelevant_indicator:
                     is_relevant = False
             
             # Extract title if mentioned (look for patterns like "Title: ...")
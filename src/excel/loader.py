@@ -6,6 +6,8 @@ from utils.data_types import WorkbookData, SheetData, CellState
 from utils.exceptions import ExcelFormatError
 import logging
 import os
+import shutil
+import tempfile
 
 logger = logging.getLogger(__name__)
 
@@ -43,10 +45,39 @@ class ExcelLoader:
             raise ExcelFormatError("File must be an Excel file (.xlsx or .xls)")
         
         try:
-            wb = openpyxl.load_workbook(file_path, data_only=True)
+            # Only cell values are needed here, so stream the sheets read-only
+            # instead of building the full styled workbook in memory
+            wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         except Exception as e:
             raise ExcelFormatError(f"Invalid Excel file: {e}")
         
+        try:
+            sheets = self._load_sheets(wb)
+        finally:
+            wb.close()
+        
+        if not sheets:
+            raise ExcelFormatError("No visible sheets with questions found")
+        
+        # Limit total sheets
+        if len(sheets) > 10:
+            logger.warning(f"Workbook has {len(sheets)} sheets, limiting to 10")
+            sheets = sheets[:10]
+        
+        total_questions = sum(len(s.questions) for s in sheets)
+        logger.info(f"Loaded {len(sheets)} sheets with {total_questions} total questions")
+        
+        return WorkbookData(file_path=file_path, sheets=sheets)
+    
+    def _load_sheets(self, wb) -> List[SheetData]:
+        """Build SheetData for each visible sheet that has questions.
+        
+        Args:
+            wb: Open openpyxl workbook
+            
+        Returns:
+            SheetData list in workbook order, reindexed after skipped sheets
+        """
         sheets = []
         for sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
@@ -56,10 +87,9 @@ class ExcelLoader:
                 logger.info(f"Skipping hidden sheet: {sheet_name}")
                 continue
             
-            # Get headers from first row
-            headers = []
-            for cell in ws[1]:
-                headers.append(cell.value if cell.value else '')
+            # Get headers from first row; read-only sheets with no rows have none
+            first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            headers = [value if value else '' for value in first_row]
             
             if not headers:
                 logger.warning(f"Sheet '{sheet_name}' has no headers, skipping")
@@ -114,18 +144,7 @@ class ExcelLoader:
             )
             sheets.append(sheet_data)
         
-        if not sheets:
-            raise ExcelFormatError("No visible sheets with questions found")
-        
-        # Limit total sheets
-        if len(sheets) > 10:
-            logger.warning(f"Workbook has {len(sheets)} sheets, limiting to 10")
-            sheets = sheets[:10]
-        
-        total_questions = sum(len(s.questions) for s in sheets)
-        logger.info(f"Loaded {len(sheets)} sheets with {total_questions} total questions")
-        
-        return WorkbookData(file_path=file_path, sheets=sheets)
+        return sheets
     
     def save_workbook(self, workbook_data: WorkbookData, output_path: str = None) -> str:
         """Save all answers back to the Excel file.
@@ -160,34 +179,46 @@ class ExcelLoader:
 
             # Determine response column (default to column B if not specified)
             response_col = sheet_data.response_col_index if sheet_data.response_col_index is not None else 1
-            response_col_letter = openpyxl.utils.get_column_letter(response_col + 1)  # Convert 0-based to 1-based
+            response_column = response_col + 1  # Convert 0-based to 1-based
 
             # Write header if response column is empty
-            if ws.cell(row=1, column=response_col + 1).value is None:
-                ws.cell(row=1, column=response_col + 1, value="Response")
+            if ws.cell(row=1, column=response_column).value is None:
+                ws.cell(row=1, column=response_column, value="Response")
 
             # Write answers starting from row 2
             for row_idx, answer in enumerate(sheet_data.answers, start=2):
                 if answer:
-                    ws.cell(row=row_idx, column=response_col + 1, value=answer)
+                    ws.cell(row=row_idx, column=response_column, value=answer)
 
             # Write documentation if documentation column exists and has data
             if sheet_data.documentation_col_index is not None and hasattr(sheet_data, 'documentation'):
-                doc_col = sheet_data.documentation_col_index
+                doc_column = sheet_data.documentation_col_index + 1
 
                 # Write header if documentation column is empty
-                if ws.cell(row=1, column=doc_col + 1).value is None:
-                    ws.cell(row=1, column=doc_col + 1, value="Documentation")
+                if ws.cell(row=1, column=doc_column).value is None:
+                    ws.cell(row=1, column=doc_column, value="Documentation")
 
                 # Write documentation starting from row 2
                 for row_idx, doc in enumerate(sheet_data.documentation, start=2):
                     if doc:
-                        ws.cell(row=row_idx, column=doc_col + 1, value=doc)
+                        ws.cell(row=row_idx, column=doc_column, value=doc)
         
+        # Write to a uniquely named sibling temp file and rename it into place so
+        # save_path never holds a partially written workbook and concurrent saves
+        # do not share a temp file
+        temp_path = None
         try:
-            wb.save(save_path)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(save_path)), suffix=".xlsx")
+            os.close(fd)
+            wb.save(temp_path)
+            if os.path.exists(save_path):
+                # mkstemp creates the file with mode 0600; keep the target's permissions
+                shutil.copymode(save_path, temp_path)
+            os.replace(temp_path, save_path)
             logger.info(f"Saved workbook to {save_path}")
         except Exception as e:
+            if temp_path and os.path.exists(temp_path):
+                os.unlink(temp_path)
             raise IOError(f"Cannot save Excel file: {e}")
         finally:
             wb.close()
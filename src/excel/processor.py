@@ -581,15 +581,21 @@ class ParallelExcelProcessor:
                             self.reasoning_callback(reasoning_msg)
                     
                     # Create progress callback
+                    working_agent = None
+                    
                     def progress_callback(agent, msg, progress):
+                        nonlocal working_agent
                         progress_msg = f"Agent Set {agent_set_id} - {agent}: {msg} ({progress:.1%})"
                         logger.info(f"📊 {progress_msg}")
-                        # Emit CELL_WORKING event with agent information
-                        self._emit_event('CELL_WORKING', {
-                            'sheet_index': sheet_idx,
-                            'row_index': row_idx,
-                            'agent_name': agent
-                        })
+                        # Emit CELL_WORKING event only when the working agent changes;
+                        # repeated progress from the same agent leaves the cell unchanged
+                        if agent != working_agent:
+                            working_agent = agent
+                            self._emit_event('CELL_WORKING', {
+                                'sheet_index': sheet_idx,
+                                'row_index': row_idx,
+                                'agent_name': agent
+                            })
                         # Update UI progress bar if callback provided (pass sheet and cell info)
                         if self.progress_callback:
                             self.progress_callback(agent, msg, progress, sheet_data.sheet_name, row_idx)
@@ -909,15 +909,54 @@ class UIManager:
             ValueError: If question is empty or parameters invalid.
             NetworkError: If connectivity issues prevent processing.
             AuthenticationError: If Azure credentials are invalid.
+            RuntimeError: If called while an event loop is running in this thread.
         """
         # This method provides the interface contract for testing
         # Actual implementation is async and handled by _process_question_internal
+        # For testing purposes, return a synchronous result
+        # In production, this would be handled by the async workflow
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Checked up front so no coroutine is created that asyncio.run would reject
+            raise RuntimeError(
+                "process_single_question cannot run inside an event loop; "
+                "await process_single_question_async instead"
+            )
+        return asyncio.run(
+            self.process_single_question_async(question, context, char_limit, max_retries)
+        )
+    
+    async def process_single_question_async(
+        self, 
+        question: str, 
+        context: str = "Microsoft Azure AI", 
+        char_limit: int = 2000,
+        max_retries: int = 10
+    ) -> ProcessingResult:
+        """Process a single question on the caller's running event loop.
+        
+        Async counterpart of process_single_question for callers that already
+        run an event loop and would otherwise need a thread to bridge asyncio.run.
+        
+        Args:
+            question: User's natural language question.
+            context: Domain context for the question.
+            char_limit: Maximum characters for answer.
+            max_retries: Maximum retry attempts.
+            
+        Returns:
+            ProcessingResult with answer or error details.
+            
+        Raises:
+            ValueError: If question is empty or parameters invalid.
+        """
         if not question or len(question.strip()) < 5:
             raise ValueError("Question text must be at least 5 characters")
         
-        # For testing purposes, return a synchronous result
-        # In production, this would be handled by the async workflow
-        return asyncio.run(self._process_question_internal(question))
+        return await self._process_question_internal(question)
     
     def import_excel_file(self, file_path: str) -> ExcelProcessingResult:
         """Process questions from Excel file through batch workflow.
@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from contextlib import asynccontextmanager
 from urllib.parse import urlparse
 import aiohttp
@@ -14,6 +16,7 @@ from azure.identity import (
     EnvironmentCredential,
     ManagedIdentityCredential
 )
+from azure.core.credentials import AccessToken, AccessTokenInfo, TokenCredential, TokenRequestOptions
 from azure.core.exceptions import ClientAuthenticationError, ResourceNotFoundError
 from .config import config_manager
 from .exceptions import AuthenticationError, AzureServiceError
@@ -31,6 +34,108 @@ from agent_framework_azure_ai import AzureAIAgentClient
 logger = logging.getLogger(__name__)
 
 
+class _CachingTokenCredential:
+    """Credential wrapper that reuses access tokens until they are close to expiry.
+    
+    AzureCliCredential runs the ``az`` CLI on every get_token call, so tokens
+    are kept per scope and only refreshed when fewer than REFRESH_MARGIN
+    seconds remain.
+    """
+    
+    REFRESH_MARGIN = 300
+    
+    def __init__(self, credential):
+        """Initialize the wrapper.
+        
+        Args:
+            credential: Synchronous token credential to fetch tokens from.
+        """
+        self._credential = credential
+        self._tokens: Dict[Tuple, Union[AccessToken, AccessTokenInfo]] = {}
+        self._refresh_locks: Dict[Tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get_token(self, *scopes: str, claims: Optional[str] = None,
+                  tenant_id: Optional[str] = None, **kwargs) -> AccessToken:
+        """Get an access token, reusing a cached one while it is still fresh.
+        
+        Args:
+            *scopes: Token scopes.
+            claims: Additional claims; requests with claims always bypass the cache.
+            tenant_id: Optional tenant to request the token for.
+            **kwargs: Additional arguments passed to the wrapped credential.
+            
+        Returns:
+            Access token for the requested scopes.
+        """
+        if claims:
+            return self._credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+        
+        key = ("token", scopes, tenant_id, kwargs.get("enable_cae", False))
+        return self._get_cached(
+            key, lambda: self._credential.get_token(*scopes, tenant_id=tenant_id, **kwargs)
+        )
+    
+    def get_token_info(self, *scopes: str,
+                       options: Optional[TokenRequestOptions] = None) -> AccessTokenInfo:
+        """Get access token information, reusing a cached token while it is still fresh.
+        
+        Args:
+            *scopes: Token scopes.
+            options: Token request options; requests with claims always bypass the cache.
+            
+        Returns:
+            Access token information for the requested scopes.
+        """
+        if options and options.get("claims"):
+            return self._credential.get_token_info(*scopes, options=options)
+        
+        options = options or {}
+        key = ("token_info", scopes, options.get("tenant_id"), options.get("enable_cae", False))
+        return self._get_cached(
+            key, lambda: self._credential.get_token_info(*scopes, options=options)
+        )
+    
+    def _get_cached(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the cached token for key, fetching a new one if it is missing or expiring.
+        
+        Refreshes are serialized per key, so concurrent callers for one scope
+        share a single fetch while an interactive login for one scope does not
+        block callers of another.
+        """
+        with self._lock:
+            token = self._tokens.get(key)
+            if self._is_fresh(token):
+                return token
+            refresh_lock = self._refresh_locks.setdefault(key, threading.Lock())
+        
+        with refresh_lock:
+            # Another caller may have refreshed while we waited
+            token = self._tokens.get(key)
+            if self._is_fresh(token):
+                return token
+            token = fetch()
+            with self._lock:
+                self._tokens[key] = token
+            return token
+    
+    def _is_fresh(self, token: Optional[Union[AccessToken, AccessTokenInfo]]) -> bool:
+        """Check whether a cached token is outside the refresh margin."""
+        return token is not None and token.expires_on - time.time() > self.REFRESH_MARGIN
+    
+    def close(self) -> None:
+        """Close the wrapped credential and drop cached tokens."""
+        with self._lock:
+            self._tokens.clear()
+        self._credential.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
 class AzureAuthenticator:
     """Handles Azure authentication with fallback mechanisms."""
     
@@ -41,7 +146,7 @@ class AzureAuthenticator:
         self._project_client = None
         self._endpoint_validated = False
     
-    async def get_credential(self) -> ChainedTokenCredential:
+    async def get_credential(self) -> TokenCredential:
         """Get authenticated Azure credential with Azure CLI as primary method.
         
         Credential chain priority:
@@ -50,6 +155,8 @@ class AzureAuthenticator:
         3. ManagedIdentityCredential - For Azure-hosted apps with managed identity
         4. InteractiveBrowserCredential - Opens browser for interactive login (FALLBACK)
         
+        Access tokens are cached in memory for the life of the credential.
+        
         Returns:
             Authenticated Azure credential instance.
             
@@ -62,12 +169,12 @@ class AzureAuthenticator:
         # Create credential chain checking for existing Azure CLI login first
         # This avoids opening the browser if user has already run 'az login' or 'azd login'
         try:
-            credential = ChainedTokenCredential(
+            credential = _CachingTokenCredential(ChainedTokenCredential(
                 AzureCliCredential(),             # PRIMARY: Check for 'az login' or 'azd login' first
                 EnvironmentCredential(),          # FALLBACK: If service principal configured
                 ManagedIdentityCredential(),      # FALLBACK: If running in Azure with managed identity
                 InteractiveBrowserCredential()    # FALLBACK: Opens browser only if no other auth available
-            )
+            ))
             self._credential = credential
             logger.info("Credential chain created prioritizing existing Azure CLI login")
             return credential
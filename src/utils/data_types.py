@@ -348,8 +348,7 @@ class SheetData:
         """Return completion percentage (0.0 to 1.0)."""
         if not self.questions:
             return 0.0
-        completed = sum(1 for s in self.cell_states if s == CellState.COMPLETED)
-        return completed / len(self.questions)
+        return self.cell_states.count(CellState.COMPLETED) / len(self.questions)
     
     def get_pending_questions(self) -> List[tuple[int, str]]:
         """Returns indices and text of questions in PENDING state."""
@@ -372,8 +371,9 @@ class SheetData:
             if documentation:
                 self.documentation[row_index] = documentation
 
-            # Update completion status
-            self.is_complete = all(s == CellState.COMPLETED for s in self.cell_states)
+            # Update completion status; list.count keeps the per-answer scan in C
+            # so large sheets do not pay a Python-level loop on every completion
+            self.is_complete = self.cell_states.count(CellState.COMPLETED) == len(self.cell_states)
 
 
 @dataclass
@@ -402,10 +402,7 @@ class WorkbookData:
     @property
     def completed_questions(self) -> int:
         """Total completed questions across all sheets."""
-        return sum(
-            sum(1 for s in sheet.cell_states if s == CellState.COMPLETED)
-            for sheet in self.sheets
-        )
+        return sum(sheet.cell_states.count(CellState.COMPLETED) for sheet in self.sheets)
     
     def get_active_sheet(self) -> Optional[SheetData]:
         """Returns currently processing sheet."""
@@ -341,6 +341,7 @@ async def upload_spreadsheet(
             shutil.copyfileobj(file.file, f)
 
         # Load workbook using existing loader
+        import openpyxl
         from excel.loader import ExcelLoader
         from excel.column_identifier import ColumnIdentifier
 
@@ -348,19 +349,23 @@ async def upload_spreadsheet(
         loader = ExcelLoader(column_identifier=identifier)
         workbook_data = loader.load_workbook(temp_path)
 
-        # Get column info and data
+        # Get column info and data, parsing the file once for all sheets
         columns = {}
         sheets = []
         data = {}
         total_rows = 0
-        for sheet in workbook_data.sheets:
-            sheets.append(sheet.sheet_name)
-            # Get column names from the sheet
-            sheet_columns = _get_column_names(sheet, temp_path)
-            columns[sheet.sheet_name] = sheet_columns
-            # Get row data
-            data[sheet.sheet_name] = _get_sheet_data(temp_path, sheet.sheet_name, sheet_columns)
-            total_rows += len(data[sheet.sheet_name])
+        wb = openpyxl.load_workbook(temp_path, read_only=True, data_only=True)
+        try:
+            for sheet in workbook_data.sheets:
+                sheets.append(sheet.sheet_name)
+                # Get column names from the sheet
+                sheet_columns = _get_column_names(sheet, wb)
+                columns[sheet.sheet_name] = sheet_columns
+                # Get row data
+                data[sheet.sheet_name] = _get_sheet_data(wb, sheet.sheet_name, sheet_columns)
+                total_rows += len(data[sheet.sheet_name])
+        finally:
+            wb.close()
 
         # Get suggestions from the first sheet using AI-based column identification
         suggestions = await _identify_columns(workbook_data, columns)
@@ -386,12 +391,9 @@ async def upload_spreadsheet(
         raise HTTPException(status_code=500, detail=f"Failed to process file: {str(e)}")
 
 
-def _get_column_names(sheet, file_path: str) -> list:
-    """Extract column names from sheet by reading Excel headers."""
-    import openpyxl
-
+def _get_column_names(sheet, wb) -> list:
+    """Extract column names from sheet by reading Excel headers from an open workbook."""
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True)
         ws = wb[sheet.sheet_name]
 
         # Get headers from first row
@@ -402,7 +404,6 @@ def _get_column_names(sheet, file_path: str) -> list:
             else:
                 break
 
-        wb.close()
         return headers if headers else ["A", "B", "C", "D", "E"]
 
     except Exception as e:
@@ -418,13 +419,10 @@ def _get_column_names(sheet, file_path: str) -> list:
         return columns if columns else ["A", "B", "C", "D", "E"]
 
 
-def _get_sheet_data(file_path: str, sheet_name: str, columns: list) -> list:
-    """Extract all row data from a sheet."""
-    import openpyxl
-
+def _get_sheet_data(wb, sheet_name: str, columns: list) -> list:
+    """Extract all row data from a sheet of an open workbook."""
     rows = []
     try:
-        wb = openpyxl.load_workbook(file_path, data_only=True)
         ws = wb[sheet_name]
 
         # Skip header row, iterate data rows
@@ -439,8 +437,6 @@ def _get_sheet_data(file_path: str, sheet_name: str, columns: list) -> list:
             # Only include rows that have some data
             if any(row_dict.get(col, "") for col in columns):
                 rows.append(row_dict)
-
-        wb.close()
     except Exception as e:
         logger.warning(f"Failed to read sheet data: {e}")
 
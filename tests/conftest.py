@@ -0,0 +1,160 @@
+"""Shared pytest configuration for the test suite.
+
+Tests built on the shared live fixtures (``shared_azure_client`` and
+``live_coordinator``) are skipped unless ``--live`` is given. The
+test_live_excel_processing modules do not use them and still call Azure
+whenever it is configured.
+
+Async tests run on uvloop when it is installed (it is optional and not
+available on Windows); pass ``--mock-loop=asyncio`` to use the stock loop.
+"""
+
+import asyncio
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import openpyxl
+import pytest
+import pytest_asyncio
+
+# Add src to path once for the whole suite.
+#
+# sys.path policy: a test module that imports app code at module level also
+# inserts src itself, so it still imports when run directly with python before
+# any conftest is loaded. Modules that import app code only inside fixtures or
+# tests, or whose __main__ hands off to pytest.main, rely on this entry alone.
+project_root = Path(__file__).parent.parent
+_src = str(project_root / "src")
+if _src not in sys.path:
+    sys.path.insert(0, _src)
+
+# Import the Azure SDK-backed modules and the Excel pipeline once at collection so
+# their (roughly one second) import cost is not charged to whichever test module
+# happens to be first. question_answerer is left out because importing it
+# configures root logging.
+try:
+    import utils.config  # noqa: F401
+    import utils.azure_auth  # noqa: F401
+    import agents.workflow_manager  # noqa: F401
+    import excel.loader  # noqa: F401
+    import excel.processor  # noqa: F401
+except ImportError:
+    pass
+
+
+def pytest_addoption(parser):
+    """Register the --live option for tests that need real Azure services."""
+    parser.addoption(
+        "--live",
+        action="store_true",
+        default=False,
+        help="Run the tests that need real Azure services"
+    )
+    parser.addoption(
+        "--mock-loop",
+        choices=["uvloop", "asyncio"],
+        default="uvloop",
+        help="Event loop implementation for async tests (falls back to asyncio if uvloop is missing)"
+    )
+
+
+def pytest_configure(config):
+    """Install the uvloop event loop policy when selected and available.
+
+    Event loop policies are deprecated from Python 3.14, and Windows keeps its
+    default proactor loop.
+    """
+    if config.getoption("--mock-loop") != "uvloop":
+        return
+    if sys.platform == "win32" or sys.version_info >= (3, 14):
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# ============================================================================
+# Application Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def mock_app():
+    """One QuestionnaireAgentApp shared by the mock-mode tests.
+
+    Imported here rather than at module level because importing
+    question_answerer configures root logging.
+    """
+    from question_answerer import QuestionnaireAgentApp
+
+    return QuestionnaireAgentApp()
+
+
+# ============================================================================
+# Live Test Helpers
+# ============================================================================
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def bounded_executor():
+    """Give the session event loop a small default executor for live tests.
+
+    asyncio's default pool grows with the CPU count, so threads offloaded by the
+    Azure SDK and asyncio.to_thread are capped here instead. The loop shuts the
+    executor down when it closes.
+    """
+    executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="qa-live")
+    asyncio.get_running_loop().set_default_executor(executor)
+    yield executor
+
+
+# ============================================================================
+# Sample Questionnaire Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def sample_questionnaire_path():
+    """Path to the sample questionnaire shared by the Excel tests.
+
+    Despite its name, sample_questionnaire_1_sheet.xlsx holds the Company,
+    AI Capabilities and Dashboard sheets.
+    """
+    return project_root / "tests" / "sample_questionnaire_1_sheet.xlsx"
+
+
+@pytest.fixture(scope="session")
+def sample_questions(sample_questionnaire_path):
+    """Question texts of the sample questionnaire, parsed once per session.
+
+    Returns:
+        Dict mapping each visible sheet with a "Question" header to its
+        questions, read down the column until the first blank cell as
+        ExcelLoader does.
+    """
+    wb = openpyxl.load_workbook(sample_questionnaire_path, read_only=True, data_only=True)
+    try:
+        questions = {}
+        for ws in wb.worksheets:
+            if ws.sheet_state != 'visible':
+                continue
+
+            rows = ws.iter_rows(values_only=True)
+            headers = next(rows, ())
+            if "Question" not in headers:
+                continue
+
+            col = headers.index("Question")
+            sheet_questions = []
+            for row in rows:
+                value = row[col] if col < len(row) else None
+                if not value or not str(value).strip():
+                    break
+                sheet_questions.append(str(value).strip())
+            questions[ws.title] = sheet_questions
+        return questions
+    finally:
+        wb.close()
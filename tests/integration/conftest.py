@@ -0,0 +1,63 @@
+"""Pytest configuration for integration tests.
+
+Provides shared Azure client and agent coordinator fixtures so live tests
+pay the authentication and connection setup cost once.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+
+# ============================================================================
+# Live Azure Fixtures
+# ============================================================================
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_azure_client(request):
+    """Authenticated Azure AI Agent client shared by all live tests.
+
+    Skips dependent tests unless ``--live`` is given, or when Azure is not
+    configured or reachable.
+    """
+    if not request.config.getoption("--live"):
+        pytest.skip("needs real Azure services; pass --live to run")
+
+    from utils.azure_auth import azure_authenticator, get_azure_client
+
+    try:
+        client = await get_azure_client()
+    except Exception as e:
+        pytest.skip(f"Azure client unavailable: {e}")
+
+    yield client
+
+    # Closes the client and project client; safe if a coordinator already did so
+    await azure_authenticator.cleanup()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def coordinator(shared_azure_client):
+    """Agent coordinator with executors created, shared across a test module."""
+    from agents.workflow_manager import AgentCoordinator
+
+    agent_coordinator = AgentCoordinator(
+        azure_client=shared_azure_client,
+        bing_connection_id=os.getenv("BING_CONNECTION_ID", "BingSearch"),
+        browser_automation_connection_id=os.getenv("BROWSER_AUTOMATION_CONNECTION_ID", "BrowserAutomation")
+    )
+    await agent_coordinator.create_agents()
+
+    yield agent_coordinator
+
+    # cleanup_agents() would also close the shared client, so only release
+    # this module's executors and leave the client to shared_azure_client
+    for executor in (agent_coordinator.question_answerer, agent_coordinator.answer_checker):
+        if executor:
+            await executor.cleanup()
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import openpyxl
 import pytest
 
 # Add src to path
@@ -9,16 +10,15 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from excel.loader import ExcelLoader
 from excel.column_identifier import ColumnIdentifier
+from utils.exceptions import ExcelFormatError
 
 
 class TestExcelLoaderIntegration:
     """Integration tests for Excel loader with column identification."""
     
-    def test_load_sample_questionnaire_1_sheet(self):
+    def test_load_sample_questionnaire_1_sheet(self, sample_questionnaire_path, sample_questions):
         """Test loading the sample_questionnaire_1_sheet.xlsx file with column identification."""
-        # Get path to sample file
-        test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sample_file = os.path.join(test_dir, 'sample_questionnaire_1_sheet.xlsx')
+        sample_file = str(sample_questionnaire_path)
         
         # Verify file exists
         assert os.path.exists(sample_file), f"Sample file not found: {sample_file}"
@@ -46,6 +46,7 @@ class TestExcelLoaderIntegration:
         
         # Verify questions were loaded from the correct column
         assert len(sheet.questions) > 0, "Should have loaded questions"
+        assert sheet.questions == sample_questions["Company"], "Questions should match the Question column"
         
         # Verify first question matches what's in the Company sheet (using the actual character)
         # Note: The apostrophe is a Unicode right single quotation mark (U+2019)
@@ -64,11 +65,9 @@ class TestExcelLoaderIntegration:
             expected_ai_question = "How does your platform facilitate stakeholder alignment and documentation of ethical, legal, regulatory, and business considerations from project inception through AI project scoping and planning?"
             assert sheet2.questions[0] == expected_ai_question, f"AI Capabilities first question doesn't match"
     
-    def test_load_and_save_sample_questionnaire(self):
+    def test_load_and_save_sample_questionnaire(self, sample_questionnaire_path):
         """Test loading and saving the sample questionnaire file."""
-        # Get path to sample file
-        test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sample_file = os.path.join(test_dir, 'sample_questionnaire_1_sheet.xlsx')
+        sample_file = str(sample_questionnaire_path)
         
         # Create a temporary output file
         import tempfile
@@ -109,11 +108,25 @@ class TestExcelLoaderIntegration:
             if os.path.exists(output_file):
                 os.unlink(output_file)
     
-    def test_load_without_column_identifier(self):
+    def test_save_replaces_file_in_place(self, sample_questionnaire_path, tmp_path):
+        """Test that saving keeps the file's mode and leaves no temp file behind."""
+        import shutil
+        
+        output_file = str(tmp_path / "questionnaire.xlsx")
+        shutil.copy(str(sample_questionnaire_path), output_file)
+        os.chmod(output_file, 0o664)
+        
+        loader = ExcelLoader(column_identifier=ColumnIdentifier(azure_client=None))
+        workbook_data = loader.load_workbook(output_file)
+        workbook_data.sheets[0].answers[0] = "Test answer"
+        loader.save_workbook(workbook_data)
+        
+        assert os.listdir(tmp_path) == ["questionnaire.xlsx"], "Temp file should be renamed into place"
+        assert os.stat(output_file).st_mode & 0o777 == 0o664
+    
+    def test_load_without_column_identifier(self, sample_questionnaire_path):
         """Test loading with fallback when no column identifier is provided."""
-        # Get path to sample file
-        test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        sample_file = os.path.join(test_dir, 'sample_questionnaire_1_sheet.xlsx')
+        sample_file = str(sample_questionnaire_path)
         
         # Create loader without column identifier (should fall back to A=Question, B=Response)
         loader = ExcelLoader(column_identifier=None)
@@ -133,6 +146,29 @@ class TestExcelLoaderIntegration:
         # The important thing is it doesn't crash
         assert sheet.question_col_index == 0  # Fallback to column A
         assert sheet.response_col_index == 1  # Fallback to column B
+    
+    def test_empty_sheet_next_to_question_sheet_is_skipped(self, tmp_path):
+        """Test that an empty sheet is skipped instead of failing the whole load."""
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Questions"
+        ws.append(["Question", "Response"])
+        ws.append(["Q"])
+        wb.create_sheet("Sheet2")
+        sample_file = str(tmp_path / "with_empty_sheet.xlsx")
+        wb.save(sample_file)
+        
+        workbook_data = ExcelLoader(column_identifier=None).load_workbook(sample_file)
+        
+        assert [sheet.sheet_name for sheet in workbook_data.sheets] == ["Questions"]
+        assert workbook_data.sheets[0].questions == ["Q"]
+    
+    def test_invalid_format_fixture_raises_excel_format_error(self):
+        """Test that a workbook without question sheets raises ExcelFormatError."""
+        sample_file = os.path.join(os.path.dirname(__file__), '..', 'fixtures', 'excel', 'invalid_format.xlsx')
+        
+        with pytest.raises(ExcelFormatError, match="No visible sheets with questions found"):
+            ExcelLoader(column_identifier=None).load_workbook(sample_file)
 
 
 if __name__ == '__main__':
@@ -5,14 +5,17 @@ import logging
 import os
 import sys
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
-from agents.link_checker import LinkCheckerExecutor
+from agents.link_checker import (
+    LinkCheckerExecutor, clear_connection_id_cache, _CONNECTION_ID_CACHE_SIZE
+)
 from utils.data_types import Question, ValidationStatus
 from utils.exceptions import AgentExecutionError
 
@@ -25,76 +28,99 @@ test_handler = logging.StreamHandler()
 test_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
 test_logger.addHandler(test_handler)
 
+# Full resource ID the mocked project resolves "BrowserAutomation" to
+_FULL_CONNECTION_ID = "/subscriptions/test-sub/resourceGroups/test-rg/providers/Microsoft.CognitiveServices/accounts/test-account/projects/test-project/connections/BrowserAutomation"
+
+
+def _build_mock_azure_client():
+    """Build a mock azure_client whose project connections resolve to _FULL_CONNECTION_ID."""
+    # Mock connection object with full ID
+    mock_connection = SimpleNamespace(id=_FULL_CONNECTION_ID)
+    
+    # Only the async project_client.connections.get chain is exercised
+    mock_project_client = SimpleNamespace(
+        connections=SimpleNamespace(get=AsyncMock(return_value=mock_connection))
+    )
+    mock_azure_client = SimpleNamespace(project_client=mock_project_client)
+    
+    return mock_azure_client
+
+
+def _build_failing_azure_client():
+    """Build a mock azure_client whose project connection lookup always fails."""
+    # Mock async failure
+    mock_project_client = SimpleNamespace(
+        connections=SimpleNamespace(get=AsyncMock(
+            side_effect=Exception("Connection 'NonExistent' not found in project")
+        ))
+    )
+    return SimpleNamespace(project_client=mock_project_client)
+
+
+@pytest.fixture(autouse=True)
+def _cold_connection_id_cache():
+    """Start and leave each test with an empty shared connection ID cache."""
+    clear_connection_id_cache()
+    yield
+    clear_connection_id_cache()
+
+
+@pytest.fixture(scope="class")
+def mock_azure_client():
+    """Class-scoped azure_client shared by the successful resolution tests.
+    
+    Each test builds its own executor, so the resolved connection ID cache
+    stays isolated even though the mock client is reused.
+    """
+    yield _build_mock_azure_client()
+
+
+@pytest.fixture(scope="class")
+def failing_azure_client():
+    """Class-scoped azure_client whose connection lookup always fails."""
+    yield _build_failing_azure_client()
+
 
 class TestConnectionResolution:
     """Tests for connection ID resolution in LinkCheckerExecutor."""
     
     @pytest.mark.asyncio
-    async def test_async_connection_get_is_awaited(self):
+    async def test_async_connection_get_is_awaited(self, mock_azure_client):
         """Test that connections.get() is properly awaited."""
         
         test_logger.info("\n" + "=" * 60)
         test_logger.info("TEST: Async connection.get() is properly awaited")
         test_logger.info("=" * 60)
         
-        # Create mock azure_client
-        mock_azure_client = MagicMock()
-        mock_project_client = MagicMock()
-        mock_azure_client.project_client = mock_project_client
-        
-        # Mock connection object with full ID
-        mock_connection = MagicMock()
-        full_id = "/subscriptions/test-sub/resourceGroups/test-rg/providers/Microsoft.CognitiveServices/accounts/test-account/projects/test-project/connections/BrowserAutomation"
-        mock_connection.id = full_id
-        
-        # Mock the async connections.get method
-        async def async_get(*args, **kwargs):
-            return mock_connection
-        
-        mock_project_client.connections.get = async_get
-        
         # Create executor
         executor = LinkCheckerExecutor(
             azure_client=mock_azure_client,
-            browser_automation_connection_id="BrowserAutomation"
+            browser_automation_connection_id="BrowserAutomation",
+            project_client=mock_azure_client.project_client
         )
         
         # Test resolution
         resolved_id = await executor._resolve_connection_id()
         
         # Verify
-        assert resolved_id == full_id
+        assert resolved_id == _FULL_CONNECTION_ID
         test_logger.info(f"✅ Successfully resolved async connection ID")
-        assert executor.browser_automation_connection_id == full_id
+        assert executor.browser_automation_connection_id == _FULL_CONNECTION_ID
         test_logger.info(f"✅ Connection ID cached correctly")
     
     @pytest.mark.asyncio
-    async def test_connection_resolution_called_during_agent_creation(self):
+    async def test_connection_resolution_called_during_agent_creation(self, mock_azure_client):
         """Test that connection resolution happens when agent is created."""
         
         test_logger.info("\n" + "=" * 60)
         test_logger.info("TEST: Connection resolution happens during agent creation")
         test_logger.info("=" * 60)
         
-        # Create mock azure_client
-        mock_azure_client = MagicMock()
-        mock_project_client = MagicMock()
-        mock_azure_client.project_client = mock_project_client
-        
-        # Mock connection
-        mock_connection = MagicMock()
-        full_id = "/subscriptions/test-sub/resourceGroups/test-rg/providers/Microsoft.CognitiveServices/accounts/test-account/projects/test-project/connections/BrowserAutomation"
-        mock_connection.id = full_id
-        
-        async def async_get(*args, **kwargs):
-            return mock_connection
-        
-        mock_project_client.connections.get = async_get
-        
         # Create executor
         executor = LinkCheckerExecutor(
             azure_client=mock_azure_client,
-            browser_automation_connection_id="BrowserAutomation"
+            browser_automation_connection_id="BrowserAutomation",
+            project_client=mock_azure_client.project_client
         )
         
         # Before getting agent, connection ID should be None
@@ -106,64 +132,114 @@ class TestConnectionResolution:
             agent = await executor._get_agent()
             
             # Verify BrowserAutomationTool was called with resolved full ID
-            mock_tool_class.assert_called_once_with(connection_id=full_id)
+            mock_tool_class.assert_called_once_with(connection_id=_FULL_CONNECTION_ID)
             test_logger.info(f"✅ BrowserAutomationTool called with full connection ID")
             
             # Verify connection ID is now cached
-            assert executor.browser_automation_connection_id == full_id
+            assert executor.browser_automation_connection_id == _FULL_CONNECTION_ID
             test_logger.info(f"✅ Connection ID cached after agent creation")
     
     @pytest.mark.asyncio
-    async def test_connection_resolution_failure_raises_error(self):
-        """Test that connection resolution failures are properly handled."""
+    async def test_resolved_connection_id_shared_across_executors(self):
+        """Test that executors sharing a project_client resolve the connection once."""
         
         test_logger.info("\n" + "=" * 60)
-        test_logger.info("TEST: Connection resolution failure handling")
+        test_logger.info("TEST: Resolved connection ID is shared across executors")
         test_logger.info("=" * 60)
         
-        # Create mock azure_client that fails
-        mock_azure_client = MagicMock()
-        mock_project_client = MagicMock()
-        mock_azure_client.project_client = mock_project_client
+        azure_client = _build_mock_azure_client()
+        
+        for _ in range(2):
+            executor = LinkCheckerExecutor(
+                azure_client=azure_client,
+                browser_automation_connection_id="BrowserAutomation",
+                project_client=azure_client.project_client
+            )
+            assert await executor._resolve_connection_id() == _FULL_CONNECTION_ID
+        
+        azure_client.project_client.connections.get.assert_awaited_once_with("BrowserAutomation")
+        test_logger.info("✅ connections.get() awaited once for both executors")
+    
+    @pytest.mark.asyncio
+    async def test_connection_id_cache_is_bounded(self):
+        """Test that the least recently used project client is evicted past the cache size."""
+        
+        test_logger.info("\n" + "=" * 60)
+        test_logger.info("TEST: Connection ID cache is bounded")
+        test_logger.info("=" * 60)
         
-        # Mock async failure
-        async def async_get_failure(*args, **kwargs):
-            raise Exception("Connection 'NonExistent' not found in project")
+        azure_clients = [_build_mock_azure_client() for _ in range(_CONNECTION_ID_CACHE_SIZE + 1)]
+        
+        async def resolve(azure_client):
+            executor = LinkCheckerExecutor(
+                azure_client=azure_client,
+                browser_automation_connection_id="BrowserAutomation",
+                project_client=azure_client.project_client
+            )
+            return await executor._resolve_connection_id()
+        
+        for azure_client in azure_clients:
+            assert await resolve(azure_client) == _FULL_CONNECTION_ID
+        
+        # The first client was evicted and resolves again; the newest is still cached
+        await resolve(azure_clients[0])
+        await resolve(azure_clients[-1])
+        assert azure_clients[0].project_client.connections.get.await_count == 2
+        azure_clients[-1].project_client.connections.get.assert_awaited_once()
+        test_logger.info("✅ Oldest project client evicted from the connection ID cache")
+    
+    @pytest.mark.asyncio
+    async def test_connection_resolution_failure_raises_error(self, failing_azure_client):
+        """Test that connection resolution failures are properly handled."""
         
-        mock_project_client.connections.get = async_get_failure
+        test_logger.info("\n" + "=" * 60)
+        test_logger.info("TEST: Connection resolution failure handling")
+        test_logger.info("=" * 60)
         
         # Create executor
         executor = LinkCheckerExecutor(
-            azure_client=mock_azure_client,
-            browser_automation_connection_id="NonExistent"
+            azure_client=failing_azure_client,
+            browser_automation_connection_id="NonExistent",
+            project_client=failing_azure_client.project_client
         )
         
         # Test that error is raised
-        try:
+        with pytest.raises(AgentExecutionError, match="Failed to resolve Browser Automation connection"):
             await executor._resolve_connection_id()
-            assert False, "Should have raised AgentExecutionError"
-        except AgentExecutionError as e:
-            assert "Failed to resolve Browser Automation connection" in str(e)
-            test_logger.info(f"✅ Correctly raised AgentExecutionError on resolution failure")
+        test_logger.info(f"✅ Correctly raised AgentExecutionError on resolution failure")
 
 
 async def run_all_tests():
-    """Run all tests."""
+    """Run the tests concurrently, then the cache eviction test on its own."""
     test_suite = TestConnectionResolution()
+    mock_azure_client = _build_mock_azure_client()
+    
+    results = await asyncio.gather(
+        test_suite.test_async_connection_get_is_awaited(mock_azure_client),
+        test_suite.test_connection_resolution_called_during_agent_creation(mock_azure_client),
+        test_suite.test_resolved_connection_id_shared_across_executors(),
+        test_suite.test_connection_resolution_failure_raises_error(_build_failing_azure_client()),
+        return_exceptions=True
+    )
     
+    # The eviction check fills the shared cache, so it runs alone on a cold cache
+    clear_connection_id_cache()
     try:
-        await test_suite.test_async_connection_get_is_awaited()
-        await test_suite.test_connection_resolution_called_during_agent_creation()
-        await test_suite.test_connection_resolution_failure_raises_error()
-        
-        print("\n" + "=" * 60)
-        print("✅ ALL TESTS PASSED!")
-        print("=" * 60)
-        return 0
+        await test_suite.test_connection_id_cache_is_bounded()
     except Exception as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        logger.exception("Test failure details:")
+        results.append(e)
+    
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if failures:
+        for failure in failures:
+            print(f"\n❌ TEST FAILED: {failure}")
+            logger.error("Test failure details:", exc_info=failure)
         return 1
+    
+    print("\n" + "=" * 60)
+    print("✅ ALL TESTS PASSED!")
+    print("=" * 60)
+    return 0
 
 
 if __name__ == "__main__":
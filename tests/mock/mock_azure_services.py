@@ -2,10 +2,57 @@
 
 import asyncio
 import json
+import os
 import random
+import re
+import time
+import zlib
 from typing import Any, Dict, List, Optional, Union
 from unittest.mock import Mock, AsyncMock
-from datetime import datetime
+
+
+# Epoch-seconds source for mock timestamps (avoids building a datetime per call)
+_now = time.time
+
+# Set MOCK_AZURE_SIMULATE_LATENCY=1 to restore the simulated network/auth delays
+_SIMULATE_LATENCY = os.getenv("MOCK_AZURE_SIMULATE_LATENCY") == "1"
+
+
+async def _simulate_delay(seconds: float) -> None:
+    """Yield to the event loop, sleeping only when latency simulation is enabled.
+
+    Args:
+        seconds: Delay to simulate when MOCK_AZURE_SIMULATE_LATENCY is set.
+    """
+    await asyncio.sleep(seconds if _SIMULATE_LATENCY else 0)
+
+
+# Canned agent responses, shared by every mock client instance
+_MOCK_ANSWERS = (
+    "Azure AI supports various video generation capabilities through Azure OpenAI Service and Azure Cognitive Services. "
+    "You can use models like DALL-E for image generation and combine with video synthesis tools. "
+    "For more information, see: https://docs.microsoft.com/azure/ai-services/openai/",
+
+    "Microsoft Azure provides comprehensive AI services including machine learning, cognitive services, and OpenAI integration. "
+    "The platform offers scalable solutions for businesses of all sizes. "
+    "Learn more at: https://azure.microsoft.com/services/machine-learning/",
+
+    "Azure AI Foundry is a unified platform for building, deploying, and managing AI applications. "
+    "It provides tools for model fine-tuning, prompt engineering, and responsible AI practices. "
+    "Documentation: https://docs.microsoft.com/azure/ai-foundry/",
+)
+
+_MOCK_VALIDATIONS = (
+    "APPROVED: The answer provides accurate information about Azure AI services with proper documentation links.",
+    "REJECTED: The answer contains outdated information. Please provide current Azure AI capabilities.",
+    "APPROVED: Content is factually correct and within character limits. Links are relevant to the topic.",
+)
+
+_MOCK_LINK_CHECKS = (
+    "LINKS_VALID: All documentation links are accessible and relevant to Azure AI services.",
+    "LINKS_INVALID: Found 1 broken link. Please replace with current documentation URLs.",
+    "LINKS_VALID: All Microsoft documentation links verified and content is relevant.",
+)
 
 
 class MockAzureAIAgentClient:
@@ -27,6 +74,16 @@ class MockAzureAIAgentClient:
         self._agent_counter = 0
         self._thread_counter = 0
         self._run_counter = 0
+        # Per-instance seeded RNG keeps mock ids and run completion reproducible across runs
+        self._rng = random.Random(0xC0DE)
+        # Response generators keyed by agent type, used by list_messages
+        self._content_generators = {
+            "question_answerer": self._generate_mock_answer,
+            "answer_checker": self._generate_mock_validation,
+            "link_checker": self._generate_mock_link_check,
+        }
+        # Fields shared by every assistant reply message
+        self._msg_template = {"object": "thread.message", "role": "assistant"}
     
     async def create_agent(
         self,
@@ -48,7 +105,7 @@ class MockAzureAIAgentClient:
         Returns:
             Mock agent object.
         """
-        await asyncio.sleep(0.1)  # Simulate network delay
+        await _simulate_delay(0.1)  # Simulate network delay
         
         agent_id = f"mock_agent_{self._agent_counter}"
         self._agent_counter += 1
@@ -60,7 +117,7 @@ class MockAzureAIAgentClient:
             "name": name,
             "instructions": instructions,
             "tools": tools or [],
-            "created_at": int(datetime.now().timestamp()),
+            "created_at": int(_now()),
             "metadata": {}
         }
         
@@ -73,7 +130,7 @@ class MockAzureAIAgentClient:
         Returns:
             Mock thread object.
         """
-        await asyncio.sleep(0.05)  # Simulate network delay
+        await _simulate_delay(0.05)  # Simulate network delay
         
         thread_id = f"mock_thread_{self._thread_counter}"
         self._thread_counter += 1
@@ -81,7 +138,7 @@ class MockAzureAIAgentClient:
         thread = {
             "id": thread_id,
             "object": "thread",
-            "created_at": int(datetime.now().timestamp()),
+            "created_at": int(_now()),
             "metadata": {}
         }
         
@@ -106,15 +163,15 @@ class MockAzureAIAgentClient:
         Returns:
             Mock message object.
         """
-        await asyncio.sleep(0.02)  # Simulate network delay
+        await _simulate_delay(0.02)  # Simulate network delay
         
         message = {
-            "id": f"mock_msg_{random.randint(1000, 9999)}",
+            "id": f"mock_msg_{self._rng.randint(1000, 9999)}",
             "object": "thread.message",
             "thread_id": thread_id,
             "role": role,
             "content": [{"type": "text", "text": {"value": content}}],
-            "created_at": int(datetime.now().timestamp()),
+            "created_at": int(_now()),
             "metadata": {}
         }
         
@@ -136,7 +193,7 @@ class MockAzureAIAgentClient:
         Returns:
             Mock run object.
         """
-        await asyncio.sleep(0.1)  # Simulate network delay
+        await _simulate_delay(0.1)  # Simulate network delay
         
         run_id = f"mock_run_{self._run_counter}"
         self._run_counter += 1
@@ -147,7 +204,7 @@ class MockAzureAIAgentClient:
             "thread_id": thread_id,
             "assistant_id": assistant_id,
             "status": "in_progress",
-            "created_at": int(datetime.now().timestamp()),
+            "created_at": int(_now()),
             "metadata": {}
         }
         
@@ -164,16 +221,16 @@ class MockAzureAIAgentClient:
         Returns:
             Mock run object with updated status.
         """
-        await asyncio.sleep(0.05)  # Simulate network delay
+        await _simulate_delay(0.05)  # Simulate network delay
         
         run = self.runs.get(run_id, {})
         
         # Simulate run completion after a few checks
         if run.get("status") == "in_progress":
             # Randomly complete the run
-            if random.random() > 0.3:  # 70% chance to complete
+            if self._rng.random() > 0.3:  # 70% chance to complete
                 run["status"] = "completed"
-                run["completed_at"] = int(datetime.now().timestamp())
+                run["completed_at"] = int(_now())
         
         return run
     
@@ -187,27 +244,17 @@ class MockAzureAIAgentClient:
         Returns:
             Mock messages list.
         """
-        await asyncio.sleep(0.05)  # Simulate network delay
+        await _simulate_delay(0.05)  # Simulate network delay
         
         # Generate mock response based on agent type
-        agent_type = kwargs.get("agent_type", "question_answerer")
-        
-        if agent_type == "question_answerer":
-            content = self._generate_mock_answer()
-        elif agent_type == "answer_checker":
-            content = self._generate_mock_validation()
-        elif agent_type == "link_checker":
-            content = self._generate_mock_link_check()
-        else:
-            content = "Mock response from agent."
+        content = self._content_for(kwargs.get("agent_type", "question_answerer"), thread_id)
         
         mock_message = {
-            "id": f"mock_msg_response_{random.randint(1000, 9999)}",
-            "object": "thread.message",
+            **self._msg_template,
+            "id": f"mock_msg_response_{self._rng.randint(1000, 9999)}",
             "thread_id": thread_id,
-            "role": "assistant",
             "content": [{"type": "text", "text": {"value": content}}],
-            "created_at": int(datetime.now().timestamp()),
+            "created_at": int(_now()),
             "metadata": {}
         }
         
@@ -219,40 +266,28 @@ class MockAzureAIAgentClient:
             "has_more": False
         }
     
-    def _generate_mock_answer(self) -> str:
+    def _content_for(self, agent_type: str, thread_id: str) -> str:
+        """Generate mock response content for the given agent type and thread.
+        
+        The reply is picked by a hash of the thread id rather than the shared
+        RNG, so concurrent callers get the same replies however they interleave.
+        """
+        generator = self._content_generators.get(agent_type)
+        if not generator:
+            return "Mock response from agent."
+        return generator(zlib.crc32(thread_id.encode()))
+    
+    def _generate_mock_answer(self, key: int) -> str:
         """Generate a mock answer from Question Answerer agent."""
-        answers = [
-            "Azure AI supports various video generation capabilities through Azure OpenAI Service and Azure Cognitive Services. "
-            "You can use models like DALL-E for image generation and combine with video synthesis tools. "
-            "For more information, see: https://docs.microsoft.com/azure/ai-services/openai/",
-            
-            "Microsoft Azure provides comprehensive AI services including machine learning, cognitive services, and OpenAI integration. "
-            "The platform offers scalable solutions for businesses of all sizes. "
-            "Learn more at: https://azure.microsoft.com/services/machine-learning/",
-            
-            "Azure AI Foundry is a unified platform for building, deploying, and managing AI applications. "
-            "It provides tools for model fine-tuning, prompt engineering, and responsible AI practices. "
-            "Documentation: https://docs.microsoft.com/azure/ai-foundry/"
-        ]
-        return random.choice(answers)
+        return _MOCK_ANSWERS[key % len(_MOCK_ANSWERS)]
     
-    def _generate_mock_validation(self) -> str:
+    def _generate_mock_validation(self, key: int) -> str:
         """Generate a mock validation response from Answer Checker agent."""
-        validations = [
-            "APPROVED: The answer provides accurate information about Azure AI services with proper documentation links.",
-            "REJECTED: The answer contains outdated information. Please provide current Azure AI capabilities.",
-            "APPROVED: Content is factually correct and within character limits. Links are relevant to the topic."
-        ]
-        return random.choice(validations)
+        return _MOCK_VALIDATIONS[key % len(_MOCK_VALIDATIONS)]
     
-    def _generate_mock_link_check(self) -> str:
+    def _generate_mock_link_check(self, key: int) -> str:
         """Generate a mock link validation response from Link Checker agent."""
-        link_checks = [
-            "LINKS_VALID: All documentation links are accessible and relevant to Azure AI services.",
-            "LINKS_INVALID: Found 1 broken link. Please replace with current documentation URLs.",
-            "LINKS_VALID: All Microsoft documentation links verified and content is relevant."
-        ]
-        return random.choice(link_checks)
+        return _MOCK_LINK_CHECKS[key % len(_MOCK_LINK_CHECKS)]
     
     async def delete_agent(self, agent_id: str) -> None:
         """Delete a mock agent.
@@ -260,7 +295,7 @@ class MockAzureAIAgentClient:
         Args:
             agent_id: Agent identifier to delete.
         """
-        await asyncio.sleep(0.02)
+        await _simulate_delay(0.02)
         if agent_id in self.agents:
             del self.agents[agent_id]
     
@@ -270,7 +305,7 @@ class MockAzureAIAgentClient:
         Args:
             thread_id: Thread identifier to delete.
         """
-        await asyncio.sleep(0.02)
+        await _simulate_delay(0.02)
         if thread_id in self.threads:
             del self.threads[thread_id]
 
@@ -285,6 +320,7 @@ class MockDefaultAzureCredential:
             exclude_interactive_browser_credential: Whether to exclude browser auth.
         """
         self.exclude_interactive = exclude_interactive_browser_credential
+        self._rng = random.Random()
     
     async def get_token(self, *args, **kwargs):
         """Mock token retrieval.
@@ -292,11 +328,11 @@ class MockDefaultAzureCredential:
         Returns:
             Mock access token.
         """
-        await asyncio.sleep(0.1)  # Simulate auth delay
+        await _simulate_delay(0.1)  # Simulate auth delay
         
         mock_token = Mock()
-        mock_token.token = "mock_access_token_" + str(random.randint(10000, 99999))
-        mock_token.expires_on = datetime.now().timestamp() + 3600  # 1 hour
+        mock_token.token = "mock_access_token_" + str(self._rng.randint(10000, 99999))
+        mock_token.expires_on = _now() + 3600  # 1 hour
         
         return mock_token
 
@@ -306,7 +342,7 @@ class MockInteractiveBrowserCredential:
     
     def __init__(self, **kwargs):
         """Initialize mock interactive credential."""
-        pass
+        self._rng = random.Random()
     
     async def get_token(self, *args, **kwargs):
         """Mock interactive token retrieval.
@@ -314,11 +350,11 @@ class MockInteractiveBrowserCredential:
         Returns:
             Mock access token.
         """
-        await asyncio.sleep(0.2)  # Simulate browser auth delay
+        await _simulate_delay(0.2)  # Simulate browser auth delay
         
         mock_token = Mock()
-        mock_token.token = "mock_interactive_token_" + str(random.randint(10000, 99999))
-        mock_token.expires_on = datetime.now().timestamp() + 3600  # 1 hour
+        mock_token.token = "mock_interactive_token_" + str(self._rng.randint(10000, 99999))
+        mock_token.expires_on = _now() + 3600  # 1 hour
         
         return mock_token
 
@@ -371,6 +407,16 @@ class MockPlaywrightBrowser:
 class MockPlaywrightPage:
     """Mock Playwright page for URL testing."""
     
+    # Seconds to stall before raising on "timeout" URLs; 0 raises immediately
+    TIMEOUT_DELAY = 0.0
+    
+    # URL markers that trigger simulated failures, matched in a single scan
+    _URL_RE = re.compile(r"broken|404|timeout")
+    _URL_RESPONSES = {
+        "broken": (404, "Page Not Found"),
+        "404": (404, "Page Not Found"),
+    }
+    
     def __init__(self):
         """Initialize mock page."""
         self.status = 200
@@ -386,18 +432,20 @@ class MockPlaywrightPage:
         Returns:
             Mock response.
         """
-        await asyncio.sleep(0.1)  # Simulate page load
-        
-        # Simulate different responses based on URL
-        if "broken" in url or "404" in url:
-            self.status = 404
-            self.title = "Page Not Found"
-        elif "timeout" in url:
-            await asyncio.sleep(5)  # Simulate timeout
-            raise Exception("Navigation timeout")
-        else:
+        await _simulate_delay(0.1)  # Simulate page load
+        
+        # Simulate different responses based on URL; broken/404 take precedence over timeout
+        tags = self._URL_RE.findall(url)
+        if not tags:
             self.status = 200
             self.title = "Azure Documentation - Microsoft Docs"
+        else:
+            response = next((self._URL_RESPONSES[tag] for tag in tags if tag in self._URL_RESPONSES), None)
+            if response is None:
+                if self.TIMEOUT_DELAY:
+                    await asyncio.sleep(self.TIMEOUT_DELAY)  # Simulate timeout
+                raise asyncio.TimeoutError("Navigation timeout")
+            self.status, self.title = response
         
         mock_response = Mock()
         mock_response.status = self.status
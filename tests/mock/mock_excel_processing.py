@@ -1,15 +1,32 @@
 """Mock Azure services for ExcelProcessor testing."""
 
 import asyncio
+from operator import countOf
 from typing import Optional, Dict, Any
 from unittest.mock import AsyncMock, MagicMock
-from ...src.utils.data_types import Question, ProcessingResult, Answer, AgentStep, StepStatus, AgentType
-from ...src.agents.workflow_manager import AgentCoordinator
+# Import through src on sys.path (set up by tests/conftest.py) as the app code
+# does, so these types are the same objects the processor compares against
+from utils.data_types import (
+    Question, ProcessingResult, Answer, AgentStep, StepStatus, AgentType,
+    WorkbookData, SheetData, CellState
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+async def _virtual_sleep(delay: float) -> None:
+    """Stand-in for asyncio.sleep that yields once instead of waiting.
+
+    Mock timings are reported through processing_time rather than spent on
+    the wall clock, so suites using slow coordinators stay fast.
+
+    Args:
+        delay: Simulated delay in seconds (not waited for).
+    """
+    await asyncio.sleep(0)
+
+
 class MockAgentCoordinator:
     """Mock AgentCoordinator for testing Excel processing without Azure services."""
     
@@ -29,6 +46,15 @@ class MockAgentCoordinator:
         self.mock_answers = mock_answers or {}
         self.call_count = 0
         self.processed_questions = []
+        # Every _fail_period-th call fails (None: never), giving the requested success rate
+        if success_rate >= 1.0:
+            self._fail_period = None
+        elif success_rate <= 0.0:
+            self._fail_period = 1
+        else:
+            self._fail_period = max(1, round(1.0 / (1.0 - success_rate)))
+        # Sleep indirection; swap in asyncio.sleep to observe real delays
+        self._sleep = _virtual_sleep
     
     async def process_question(self, question: Question, progress_callback=None) -> ProcessingResult:
         """Mock question processing with configurable success rate.
@@ -41,19 +67,21 @@ class MockAgentCoordinator:
             ProcessingResult with mock answer or error
         """
         self.call_count += 1
+        # Capture before awaiting, in case calls for several questions overlap
+        call_number = self.call_count
         self.processed_questions.append(question.text)
         
         # Simulate processing delay
-        await asyncio.sleep(self.processing_delay)
+        await self._sleep(self.processing_delay)
         
         # Call progress callback if provided
         if progress_callback:
             progress_callback(AgentType.QUESTION_ANSWERER, "Processing question...", 0.5)
-            await asyncio.sleep(self.processing_delay / 2)
+            await self._sleep(self.processing_delay / 2)
             progress_callback(AgentType.ANSWER_CHECKER, "Validating answer...", 0.8)
         
         # Determine success based on success rate and call count
-        should_succeed = (self.call_count % int(1.0 / self.success_rate)) != 0 if self.success_rate < 1.0 else True
+        should_succeed = self._fail_period is None or (call_number % self._fail_period) != 0
         
         if should_succeed:
             # Generate mock answer
@@ -142,6 +170,33 @@ class MockExcelProcessingService:
         return MockAgentCoordinator(success_rate=0.0)
 
 
+_COORDINATOR_FACTORIES = {
+    "success": MockExcelProcessingService.create_success_coordinator,
+    "partial": MockExcelProcessingService.create_partial_failure_coordinator,
+    "slow": MockExcelProcessingService.create_slow_coordinator,
+    "failure": MockExcelProcessingService.create_failure_coordinator,
+}
+
+
+def _create_coordinator(coordinator_type: str) -> MockAgentCoordinator:
+    """Create a mock coordinator by type name.
+    
+    Args:
+        coordinator_type: Type of mock coordinator ("success", "partial", "slow", "failure")
+        
+    Returns:
+        MockAgentCoordinator instance
+        
+    Raises:
+        ValueError: If coordinator_type is not a known type
+    """
+    try:
+        factory = _COORDINATOR_FACTORIES[coordinator_type]
+    except KeyError:
+        raise ValueError(f"Unknown coordinator type: {coordinator_type}") from None
+    return factory()
+
+
 def patch_agent_coordinator(test_case, coordinator_type: str = "success") -> MockAgentCoordinator:
     """Patch AgentCoordinator for testing.
     
@@ -152,19 +207,10 @@ def patch_agent_coordinator(test_case, coordinator_type: str = "success") -> Moc
     Returns:
         MockAgentCoordinator instance
     """
-    if coordinator_type == "success":
-        mock_coordinator = MockExcelProcessingService.create_success_coordinator()
-    elif coordinator_type == "partial":
-        mock_coordinator = MockExcelProcessingService.create_partial_failure_coordinator()
-    elif coordinator_type == "slow":
-        mock_coordinator = MockExcelProcessingService.create_slow_coordinator()
-    elif coordinator_type == "failure":
-        mock_coordinator = MockExcelProcessingService.create_failure_coordinator()
-    else:
-        raise ValueError(f"Unknown coordinator type: {coordinator_type}")
+    mock_coordinator = _create_coordinator(coordinator_type)
     
     # Patch the AgentCoordinator class
-    patcher = test_case.patch('src.agents.workflow_manager.AgentCoordinator')
+    patcher = test_case.patch('agents.workflow_manager.AgentCoordinator')
     patcher.return_value = mock_coordinator
     
     return mock_coordinator
@@ -183,16 +229,7 @@ async def process_mock_excel_questions(questions: list[str],
     Returns:
         List of ProcessingResult objects
     """
-    if coordinator_type == "success":
-        coordinator = MockExcelProcessingService.create_success_coordinator()
-    elif coordinator_type == "partial":
-        coordinator = MockExcelProcessingService.create_partial_failure_coordinator()
-    elif coordinator_type == "slow":
-        coordinator = MockExcelProcessingService.create_slow_coordinator()
-    elif coordinator_type == "failure":
-        coordinator = MockExcelProcessingService.create_failure_coordinator()
-    else:
-        raise ValueError(f"Unknown coordinator type: {coordinator_type}")
+    coordinator = _create_coordinator(coordinator_type)
     
     results = []
     for question_text in questions:
@@ -205,8 +242,6 @@ async def process_mock_excel_questions(questions: list[str],
 
 def create_mock_workbook_data():
     """Create sample WorkbookData for testing."""
-    from ...src.utils.data_types import WorkbookData, SheetData, CellState
-    
     # Sheet 1: AI Basics
     sheet1 = SheetData(
         sheet_name="AI Basics",
@@ -258,11 +293,10 @@ class ExcelProcessingTestUtils:
     @staticmethod
     def assert_sheet_progress(sheet_data, expected_completed: int):
         """Assert sheet completion progress."""
-        from ...src.utils.data_types import CellState
-        completed = sum(1 for state in sheet_data.cell_states if state == CellState.COMPLETED)
+        completed = countOf(sheet_data.cell_states, CellState.COMPLETED)
         assert completed == expected_completed
     
     @staticmethod
     def count_processing_events(events: list, event_type: str) -> int:
         """Count events of specific type."""
-        return sum(1 for event in events if event.event_type == event_type)
\ No newline at end of file
+        return countOf((event.event_type for event in events), event_type)
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""Tests for the mock Excel processing helpers."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from utils.data_types import CellState, SheetData, WorkbookData
+from tests.mock.mock_excel_processing import (
+    ExcelProcessingTestUtils, create_mock_workbook_data, process_mock_excel_questions
+)
+
+
+class TestMockWorkbookData:
+    """Test that the mock workbook interoperates with the app's data types."""
+
+    def test_mock_workbook_uses_app_data_types(self):
+        """Test that mock sheets are the SheetData the processor works with."""
+        workbook = create_mock_workbook_data()
+
+        assert isinstance(workbook, WorkbookData)
+        assert all(isinstance(sheet, SheetData) for sheet in workbook.sheets)
+
+    def test_assert_sheet_progress_counts_completed_cells(self):
+        """Test that sheet progress counts cells completed through SheetData."""
+        sheet = create_mock_workbook_data().sheets[0]
+
+        sheet.mark_completed(0, "Mock answer")
+
+        assert sheet.cell_states[0] is CellState.COMPLETED
+        ExcelProcessingTestUtils.assert_sheet_progress(sheet, 1)
+
+
+class TestProcessMockExcelQuestions:
+    """Test processing questions through the mock coordinators."""
+
+    @pytest.mark.asyncio
+    async def test_success_coordinator_answers_every_question(self):
+        """Test that the success coordinator returns canned and fallback answers."""
+        questions = ["What is artificial intelligence?", "What is a vector database?"]
+
+        results = await process_mock_excel_questions(questions, "success")
+
+        assert len(results) == 2
+        for result in results:
+            ExcelProcessingTestUtils.assert_processing_result(result, expected_success=True)
+        assert results[0].answer.content == "AI is the simulation of human intelligence in machines."
+        assert results[1].answer.content.startswith("Mock answer for: What is a vector database?")
+
+    @pytest.mark.asyncio
+    async def test_partial_failure_coordinator_fails_every_fifth_question(self):
+        """Test that an 80% success rate fails one question in five."""
+        questions = [f"Question {i}?" for i in range(1, 11)]
+
+        results = await process_mock_excel_questions(questions, "partial")
+
+        assert [result.success for result in results] == [True, True, True, True, False] * 2
+        ExcelProcessingTestUtils.assert_processing_result(results[4], expected_success=False)
+
+    @pytest.mark.asyncio
+    async def test_failure_coordinator_fails_every_question(self):
+        """Test that the failure coordinator never succeeds."""
+        results = await process_mock_excel_questions(["Question 1?", "Question 2?"], "failure")
+
+        for result in results:
+            ExcelProcessingTestUtils.assert_processing_result(result, expected_success=False)
+
+    @pytest.mark.asyncio
+    async def test_unknown_coordinator_type_raises(self):
+        """Test that an unknown coordinator type is rejected."""
+        with pytest.raises(ValueError, match="Unknown coordinator type"):
+            await process_mock_excel_questions(["Question 1?"], "flaky")
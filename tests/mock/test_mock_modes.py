@@ -1,5 +1,7 @@
 """Mock mode tests for GUI question processing without Azure dependencies."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from tests.mock.mock_azure_services import (
@@ -9,20 +11,21 @@ from tests.mock.mock_azure_services import (
 from src.utils.data_types import Question, ProcessingResult, Answer, ValidationStatus
 
 
+@pytest.fixture
+def mock_azure_setup():
+    """Set up mock Azure services for testing."""
+    mock_client = create_mock_azure_client()
+    mock_credential = create_mock_credential()
+    
+    return {
+        'client': mock_client,
+        'credential': mock_credential
+    }
+
+
 class TestMockModeGUIProcessing:
     """Test GUI question processing in mock mode without Azure dependencies."""
     
-    @pytest.fixture
-    def mock_azure_setup(self):
-        """Set up mock Azure services for testing."""
-        mock_client = create_mock_azure_client()
-        mock_credential = create_mock_credential()
-        
-        return {
-            'client': mock_client,
-            'credential': mock_credential
-        }
-    
     @pytest.fixture
     def mock_gui_application(self, mock_azure_setup):
         """Create mock GUI application with mock Azure services."""
@@ -179,7 +182,6 @@ class TestMockModeGUIProcessing:
         
         # Act
         # This would be called by the GUI button click handler
-        import asyncio
         result = asyncio.run(mock_gui_application.process_question("Test question?"))
         
         # Assert
@@ -257,14 +259,14 @@ class TestMockModeGUIProcessing:
             "How does Azure Machine Learning work?"
         ]
         
-        responses = []
-        
-        # Act - Get responses for different questions
-        for question in questions:
+        async def get_response(question):
             thread = await mock_client.create_thread()
             await mock_client.create_message(thread['id'], 'user', question)
             response = await mock_client.list_messages(thread['id'], agent_type="question_answerer")
-            responses.append(response['data'][0]['content'][0]['text']['value'])
+            return response['data'][0]['content'][0]['text']['value']
+        
+        # Act - Get responses for different questions concurrently
+        responses = await asyncio.gather(*(get_response(question) for question in questions))
         
         # Assert - Verify we get different responses
         assert len(responses) == 4
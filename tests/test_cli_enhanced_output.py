@@ -8,11 +8,17 @@ import os
 import sys
 import subprocess
 import re
-from datetime import datetime
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-def test_cli_enhanced_output():
+# Per-question CLI output patterns, compiled once
+_RX_PROC = re.compile(r"Processing question \d+:")
+_RX_ANSWER = re.compile(r"Answer: .*")
+_RX_LINKS = re.compile(r"Found \d+ documentation links")
+_RX_SUCCESS = re.compile(r"Successfully processed question \d+")
+
+
+def test_cli_enhanced_output(tmp_path):
     """Test that CLI Excel processing shows answer preview and link count."""
     
     # Get the path to the sample file
@@ -21,9 +27,8 @@ def test_cli_enhanced_output():
     # Verify the sample file exists
     assert os.path.exists(sample_file), f"Sample file not found: {sample_file}"
     
-    # Create output file with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = f"/tmp/test_cli_enhanced_output_{timestamp}.xlsx"
+    # Output file lives in the per-test temporary directory
+    output_file = str(tmp_path / "test_cli_enhanced_output.xlsx")
     
     try:
         # Run the CLI command and capture output
@@ -46,19 +51,19 @@ def test_cli_enhanced_output():
         
         # Check for enhanced output patterns
         # Should see "Processing question X:" lines
-        processing_lines = re.findall(r"Processing question \d+:", output)
+        processing_lines = _RX_PROC.findall(output)
         assert len(processing_lines) > 0, "No 'Processing question' lines found"
         
         # Should see "Answer:" lines
-        answer_lines = re.findall(r"Answer: .*", output)
+        answer_lines = _RX_ANSWER.findall(output)
         assert len(answer_lines) > 0, "No 'Answer:' lines found in output"
         
         # Should see "Found X documentation links" lines
-        link_lines = re.findall(r"Found \d+ documentation links", output)
+        link_lines = _RX_LINKS.findall(output)
         assert len(link_lines) > 0, "No 'Found X documentation links' lines found"
         
         # Should see "Successfully processed" lines
-        success_lines = re.findall(r"Successfully processed question \d+", output)
+        success_lines = _RX_SUCCESS.findall(output)
         assert len(success_lines) > 0, "No 'Successfully processed' lines found"
         
         # For each processed question, we should have:
@@ -116,11 +121,6 @@ def test_cli_enhanced_output():
     except Exception as e:
         print(f"Test failed: {e}")
         raise
-    finally:
-        # Clean up output file
-        if os.path.exists(output_file):
-            os.remove(output_file)
 
 if __name__ == "__main__":
-    test_cli_enhanced_output()
-    print("Enhanced CLI output test completed successfully!")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-s"]))
\ No newline at end of file
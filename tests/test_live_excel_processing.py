@@ -8,15 +8,22 @@ For testing without Azure credentials, use test_mock_excel_processing.py instead
 
 import os
 import shutil
+
+import pytest
 from pathlib import Path
 from datetime import datetime
 
+_TESTS_DIR = Path(__file__).resolve().parent
+
 # Add the parent directory to the path so we can import the main module
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(_TESTS_DIR.parent))
 
 from question_answerer import QuestionnaireAgentApp
 
+# One timestamp per run names this module's persisted output files
+_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+
 
 class TestExcelProcessing:
     """Test Excel processing functionality."""
@@ -27,15 +34,14 @@ class TestExcelProcessing:
         self.app = QuestionnaireAgentApp()
         
         # Sample Excel file path
-        self.sample_excel_path = Path(__file__).parent / "sample_questionnaire.xlsx"
+        self.sample_excel_path = _TESTS_DIR / "sample_questionnaire.xlsx"
         
         # Create output directory if it doesn't exist
-        self.output_dir = Path(__file__).parent.parent / "output"
+        self.output_dir = _TESTS_DIR.parent / "output"
         self.output_dir.mkdir(exist_ok=True)
         
         # Create timestamped output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_path = str(self.output_dir / f"test_excel_processing_output_{timestamp}.xlsx")
+        self.output_path = str(self.output_dir / f"test_excel_processing_output_{_TIMESTAMP}.xlsx")
         
     def teardown_method(self):
         """Cleanup after each test method."""
@@ -51,8 +57,7 @@ class TestExcelProcessing:
         """Test that Excel processing in CLI mode doesn't throw errors."""
         # Skip if sample file doesn't exist
         if not self.sample_excel_path.exists():
-            print("Sample Excel file not found, skipping test")
-            return
+            pytest.skip(f"Sample Excel file not found: {self.sample_excel_path}")
         
         try:
             # Test the CLI Excel processing method
@@ -82,8 +87,7 @@ class TestExcelProcessing:
     def test_save_processed_excel_method_robustness(self):
         """Test the save_processed_excel method with various scenarios."""
         # Create a dummy file in the output directory with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        test_file_path = self.output_dir / f"test_save_robustness_{timestamp}.xlsx"
+        test_file_path = self.output_dir / f"test_save_robustness_{_TIMESTAMP}.xlsx"
         
         try:
             # Create a test file
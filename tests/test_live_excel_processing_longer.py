@@ -12,6 +12,9 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question_answerer import QuestionnaireAgentApp
 
+# One timestamp per run names this module's persisted output file
+_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+
 def test_excel_processing_longer():
     """Test that Excel processing doesn't throw errors with the longer sample file."""
     
@@ -26,8 +29,7 @@ def test_excel_processing_longer():
     os.makedirs(output_dir, exist_ok=True)
     
     # Create output file in the output directory with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(output_dir, f"test_excel_processing_longer_output_{timestamp}.xlsx")
+    output_file = os.path.join(output_dir, f"test_excel_processing_longer_output_{_TIMESTAMP}.xlsx")
     
     try:
         # Create the application in headless mode
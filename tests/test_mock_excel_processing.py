@@ -5,51 +5,35 @@ Test Excel processing functionality using mock mode (no Azure credentials requir
 
 import os
 import shutil
-from pathlib import Path
-from datetime import datetime
 
-# Add the parent directory to the path so we can import the main module
 import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from question_answerer import QuestionnaireAgentApp
+import pytest
 
 
 class TestMockExcelProcessing:
     """Test Excel processing functionality with mock mode."""
     
-    def setup_method(self):
-        """Setup for each test method."""
-        # Create a test app instance in headless mode with mock enabled
-        self.app = QuestionnaireAgentApp()
-        
-        # Sample Excel file path
-        self.sample_excel_path = Path(__file__).parent / "sample_questionnaire.xlsx"
-        
-        # Create output directory if it doesn't exist
-        self.output_dir = Path(__file__).parent.parent / "output"
-        self.output_dir.mkdir(exist_ok=True)
-        
-        # Create timestamped output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.output_path = str(self.output_dir / f"test_mock_excel_processing_output_{timestamp}.xlsx")
-        
-    def teardown_method(self):
-        """Cleanup after each test method."""
-        # Only clean up the output file if the test failed
-        # Otherwise, keep it in the output directory for inspection
-        pass
+    @pytest.fixture(autouse=True)
+    def _use_session_fixtures(self, mock_app, sample_questionnaire_path, tmp_path):
+        """Use the session-wide mock-mode application and sample workbook.
+
+        Output goes to the per-test tmp_path so runs leave nothing behind.
+        """
+        self.app = mock_app
+        self.sample_excel_path = sample_questionnaire_path
+        self.output_path = str(tmp_path / "test_mock_excel_processing_output.xlsx")
     
     def test_excel_file_exists(self):
         """Verify that the sample Excel file exists."""
         assert self.sample_excel_path.exists(), f"Sample Excel file not found: {self.sample_excel_path}"
     
+    @pytest.mark.slow
     def test_mock_excel_processing_cli_no_error(self):
         """Test that Excel processing in CLI mode doesn't throw errors with mock mode."""
         # Skip if sample file doesn't exist
         if not self.sample_excel_path.exists():
-            print("Sample Excel file not found, skipping test")
-            return
+            pytest.skip(f"Sample Excel file not found: {self.sample_excel_path}")
         
         try:
             # Test the CLI Excel processing method with mock mode
@@ -103,45 +87,5 @@ class TestMockExcelProcessing:
             raise Exception(f"Mock single question processing failed: {e}")
 
 
-def run_tests():
-    """Run all tests manually."""
-    test_instance = TestMockExcelProcessing()
-    
-    print("Running Mock Excel processing tests...")
-    
-    # Test 1: Check file exists
-    try:
-        test_instance.setup_method()
-        test_instance.test_excel_file_exists()
-        print("✓ Test 1 passed: Sample Excel file exists")
-    except Exception as e:
-        print(f"✗ Test 1 failed: {e}")
-    finally:
-        test_instance.teardown_method()
-    
-    # Test 2: Mock single question
-    try:
-        test_instance.setup_method()
-        test_instance.test_mock_single_question()
-        print("✓ Test 2 passed: Mock single question processing")
-    except Exception as e:
-        print(f"✗ Test 2 failed: {e}")
-    finally:
-        test_instance.teardown_method()
-    
-    # Test 3: Mock Excel processing CLI
-    try:
-        test_instance.setup_method()
-        test_instance.test_mock_excel_processing_cli_no_error()
-        print("✓ Test 3 passed: Mock Excel processing CLI completed without exceptions")
-    except Exception as e:
-        print(f"✗ Test 3 failed: {e}")
-    finally:
-        test_instance.teardown_method()
-    
-    print("All mock tests completed!")
-
-
 if __name__ == "__main__":
-    # Run the tests
-    run_tests()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -5,11 +5,15 @@ Test for Excel processing functionality using the longer sample file with mock m
 
 import os
 import sys
-from datetime import datetime
+from pathlib import Path
+
+import pytest
+
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from question_answerer import QuestionnaireAgentApp
 
-def test_mock_excel_processing_longer():
+@pytest.mark.slow
+def test_mock_excel_processing_longer(mock_app, tmp_path):
     """Test that Excel processing doesn't throw errors with the longer sample file using mock mode."""
     
     # Get the path to the sample file
@@ -18,20 +22,11 @@ def test_mock_excel_processing_longer():
     # Verify the sample file exists
     assert os.path.exists(sample_file), f"Sample file not found: {sample_file}"
     
-    # Create output directory if it doesn't exist
-    output_dir = "output"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Create output file in the output directory with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = os.path.join(output_dir, f"test_mock_excel_processing_longer_output_{timestamp}.xlsx")
+    output_file = str(tmp_path / "test_mock_excel_processing_longer_output.xlsx")
     
     try:
-        # Create the application in headless mode with mock enabled
-        app = QuestionnaireAgentApp()  # Use fewer retries and enable mock mode
-        
-        # Process the Excel file
-        success = app.process_excel_file_cli(
+        # Process the Excel file with the shared mock-mode application
+        success = mock_app.process_excel_file_cli(
             input_path=sample_file,
             output_path=output_file,
             context="Microsoft Azure",
@@ -53,5 +48,7 @@ def test_mock_excel_processing_longer():
         raise e
 
 if __name__ == "__main__":
-    test_mock_excel_processing_longer()
+    output_dir = Path("output")
+    output_dir.mkdir(exist_ok=True)
+    test_mock_excel_processing_longer(QuestionnaireAgentApp(), output_dir)
     print("Mock test passed!")
\ No newline at end of file
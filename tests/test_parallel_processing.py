@@ -6,10 +6,13 @@ Test for parallel Excel processing with 3 agent sets.
 import os
 import sys
 import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
+from typing import List, NamedTuple, Tuple
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 import pytest
+import pytest_asyncio
 from excel.processor import ParallelExcelProcessor
 from utils.data_types import (
     WorkbookData, SheetData, CellState, Question, ProcessingResult, Answer, ValidationStatus
@@ -17,58 +20,102 @@ from utils.data_types import (
 from utils.ui_queue import UIUpdateQueue
 
 
-@pytest.mark.asyncio
+def make_mock_coordinators() -> List[SimpleNamespace]:
+    """Build the 3 mock agent coordinators ParallelExcelProcessor requires.
+    
+    Returns:
+        Coordinators whose process_question reports progress and reasoning and
+        returns an approved answer
+    """
+    mock_coordinators = []
+    for i in range(3):
+        # Use default parameter to capture i correctly
+        async def mock_process_question(question, progress_cb, reasoning_cb, conv_cb, agent_id=i):
+            # Report progress as the real coordinator does, so the cell is marked working
+            if progress_cb:
+                progress_cb("Question Answerer", "working", 0.5)
+            # Call the reasoning callback
+            if reasoning_cb:
+                reasoning_cb("Processing question")
+            return ProcessingResult(
+                success=True,
+                answer=Answer(
+                    content=f"Answer from agent set {agent_id + 1}",
+                    validation_status=ValidationStatus.APPROVED
+                ),
+                processing_time=0.0,
+                questions_processed=1,
+                questions_failed=0
+            )
+        mock_coordinators.append(SimpleNamespace(process_question=mock_process_question))
+    return mock_coordinators
+
+
+def make_tracking_queue() -> Tuple[List[Tuple[str, int]], SimpleNamespace]:
+    """Build a UI queue stub that records cell working/completed events.
+    
+    Returns:
+        Tuple of the (event_type, row_index) list and the queue stub
+    """
+    state_changes = []
+    
+    def track_event(event_type, payload, block=False):
+        if event_type in ['CELL_WORKING', 'CELL_COMPLETED']:
+            state_changes.append((event_type, payload['row_index']))
+    
+    return state_changes, SimpleNamespace(put_event=track_event)
+
+
+def make_noop_queue() -> SimpleNamespace:
+    """Build a UI queue stub for tests that do not inspect events."""
+    return SimpleNamespace(put_event=lambda *args, **kwargs: None)
+
+
 async def test_parallel_processor_initialization():
     """Test that ParallelExcelProcessor requires exactly 3 coordinators."""
-    mock_queue = MagicMock()
+    noop_queue = make_noop_queue()
     
     # Should fail with wrong number of coordinators
     with pytest.raises(ValueError, match="requires exactly 3 agent coordinators"):
         ParallelExcelProcessor(
-            agent_coordinators=[MagicMock()],
-            ui_update_queue=mock_queue
+            agent_coordinators=[SimpleNamespace()],
+            ui_update_queue=noop_queue
         )
     
     # Should succeed with 3 coordinators
     processor = ParallelExcelProcessor(
-        agent_coordinators=[MagicMock(), MagicMock(), MagicMock()],
-        ui_update_queue=mock_queue
+        agent_coordinators=make_mock_coordinators(),
+        ui_update_queue=noop_queue
     )
     assert processor is not None
     assert len(processor.agent_coordinators) == 3
 
 
-@pytest.mark.asyncio
-async def test_parallel_processor_distributes_work():
-    """Test that work is distributed across 3 agent sets."""
-    # Create mock coordinators
-    mock_coordinators = []
-    for i in range(3):
-        coordinator = MagicMock()
-        # Mock the process_question method to return success
-        # Use default parameter to capture i correctly
-        async def mock_process_question(question, progress_cb, reasoning_cb, conv_cb, agent_id=i):
-            return ProcessingResult(
-                success=True,
-                answer=Answer(
-                    content=f"Answer from agent set {agent_id + 1}",
-                    validation_status=ValidationStatus.APPROVED
-                ),
-                processing_time=0.1,
-                questions_processed=1,
-                questions_failed=0
-            )
-        coordinator.process_question = mock_process_question
-        mock_coordinators.append(coordinator)
+class _ProcessingRun(NamedTuple):
+    """Outcome of one process_workbook run shared by the assertion tests."""
+    processor: ParallelExcelProcessor
+    coordinators: List[SimpleNamespace]
+    workbook_data: WorkbookData
+    result: ProcessingResult
+    state_changes: List[Tuple[str, int]]
+    reasoning_messages: List[str]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def processing_run():
+    """Process a 6-question workbook once with event and reasoning capture."""
+    # Track cell state changes
+    state_changes, mock_queue = make_tracking_queue()
     
-    # Create mock UI queue
-    mock_queue = MagicMock()
-    mock_queue.put_event = MagicMock()
+    reasoning_messages = []
+    
+    mock_coordinators = make_mock_coordinators()
     
-    # Create processor
+    # Create processor with reasoning callback
     processor = ParallelExcelProcessor(
         agent_coordinators=mock_coordinators,
-        ui_update_queue=mock_queue
+        ui_update_queue=mock_queue,
+        reasoning_callback=reasoning_messages.append
     )
     
     # Create test workbook with 6 questions (so each agent set gets 2)
@@ -95,6 +142,14 @@ async def test_parallel_processor_distributes_work():
         max_retries=3
     )
     
+    return _ProcessingRun(processor, mock_coordinators, workbook_data, result, state_changes, reasoning_messages)
+
+
+def test_parallel_processor_distributes_work(processing_run):
+    """Test that work is distributed across 3 agent sets."""
+    result = processing_run.result
+    sheet_data = processing_run.workbook_data.sheets[0]
+    
     # Verify result
     assert result.success
     assert result.questions_processed == 6
@@ -103,7 +158,7 @@ async def test_parallel_processor_distributes_work():
     # Verify all coordinators were used
     # Note: In parallel execution, work distribution may be uneven
     # but at least one coordinator should have been called
-    total_calls = sum(1 for c in mock_coordinators if hasattr(c.process_question, '__call__'))
+    total_calls = sum(1 for c in processing_run.coordinators if hasattr(c.process_question, '__call__'))
     assert total_calls == 3  # All coordinators should exist
     
     # Verify all questions were processed
@@ -111,68 +166,12 @@ async def test_parallel_processor_distributes_work():
     assert all(answer is not None for answer in sheet_data.answers)
 
 
-@pytest.mark.asyncio
-async def test_parallel_processor_agent_set_identification():
+def test_parallel_processor_agent_set_identification(processing_run):
     """Test that agent sets identify themselves in reasoning messages."""
-    reasoning_messages = []
-    
-    def capture_reasoning(msg):
-        reasoning_messages.append(msg)
-    
-    # Create mock coordinators
-    mock_coordinators = []
-    for i in range(3):
-        coordinator = MagicMock()
-        async def mock_process_question(question, progress_cb, reasoning_cb, conv_cb, agent_id=i):
-            # Call the reasoning callback
-            if reasoning_cb:
-                reasoning_cb("Processing question")
-            return ProcessingResult(
-                success=True,
-                answer=Answer(
-                    content=f"Answer {agent_id + 1}",
-                    validation_status=ValidationStatus.APPROVED
-                ),
-                processing_time=0.1,
-                questions_processed=1,
-                questions_failed=0
-            )
-        coordinator.process_question = mock_process_question
-        mock_coordinators.append(coordinator)
-    
-    # Create processor with reasoning callback
-    processor = ParallelExcelProcessor(
-        agent_coordinators=mock_coordinators,
-        ui_update_queue=MagicMock(),
-        reasoning_callback=capture_reasoning
-    )
-    
-    # Create test workbook
-    sheet_data = SheetData(
-        sheet_name="Test Sheet",
-        sheet_index=0,
-        questions=["Question 1", "Question 2", "Question 3"],
-        answers=[None] * 3,
-        cell_states=[CellState.PENDING] * 3,
-        question_col_index=0,
-        response_col_index=1
-    )
-    
-    workbook_data = WorkbookData(
-        file_path="/tmp/test.xlsx",
-        sheets=[sheet_data]
-    )
-    
-    # Process workbook
-    result = await processor.process_workbook(
-        workbook_data=workbook_data,
-        context="Test Context",
-        char_limit=100,
-        max_retries=3
-    )
+    reasoning_messages = processing_run.reasoning_messages
     
     # Verify agent set identification in messages
-    assert result.success
+    assert processing_run.result.success
     assert len(reasoning_messages) > 0
     
     # Check that we have messages from different agent sets
@@ -181,83 +180,67 @@ async def test_parallel_processor_agent_set_identification():
     
     # Check that agent sets announce which question they're working on
     working_on_messages = [msg for msg in reasoning_messages if "working on question" in msg]
-    assert len(working_on_messages) == 3  # One for each question
+    assert len(working_on_messages) == 6  # One for each question
 
 
-@pytest.mark.asyncio
-async def test_parallel_processor_cell_state_transitions():
+def test_parallel_processor_cell_state_transitions(processing_run):
     """Test that cells transition from PENDING -> WORKING -> COMPLETED."""
-    # Track cell state changes
-    state_changes = []
+    state_changes = processing_run.state_changes
     
-    mock_queue = MagicMock()
-    def track_event(event_type, payload, block=False):
-        if event_type in ['CELL_WORKING', 'CELL_COMPLETED']:
-            state_changes.append((event_type, payload['row_index']))
+    # Verify state changes
+    assert processing_run.result.success
     
-    mock_queue.put_event = track_event
+    # Each question should have CELL_WORKING followed by CELL_COMPLETED
+    working_events = [idx for event_type, idx in state_changes if event_type == 'CELL_WORKING']
+    completed_events = [idx for event_type, idx in state_changes if event_type == 'CELL_COMPLETED']
     
-    # Create mock coordinators
-    mock_coordinators = []
-    for i in range(3):
-        coordinator = MagicMock()
-        async def mock_process_question(question, progress_cb, reasoning_cb, conv_cb, agent_id=i):
-            # Simulate some processing time
-            await asyncio.sleep(0.01)
-            return ProcessingResult(
-                success=True,
-                answer=Answer(
-                    content=f"Answer",
-                    validation_status=ValidationStatus.APPROVED
-                ),
-                processing_time=0.01,
-                questions_processed=1,
-                questions_failed=0
-            )
-        coordinator.process_question = mock_process_question
-        mock_coordinators.append(coordinator)
+    assert len(working_events) == 6
+    assert len(completed_events) == 6
+    assert set(working_events) == set(range(6))
+    assert set(completed_events) == set(range(6))
+
+
+async def test_parallel_processor_emits_working_event_per_agent_change():
+    """Test that repeated progress from one agent emits a single CELL_WORKING event."""
+    state_changes, tracking_queue = make_tracking_queue()
+    
+    async def mock_process_question(question, progress_cb, reasoning_cb, conv_cb):
+        for agent, progress in [("Question Answerer", 0.1), ("Question Answerer", 0.3),
+                                ("Answer Checker", 0.6), ("Answer Checker", 0.9)]:
+            progress_cb(agent, "working", progress)
+        return ProcessingResult(
+            success=True,
+            answer=Answer(content="Answer", validation_status=ValidationStatus.APPROVED),
+            processing_time=0.0,
+            questions_processed=1,
+            questions_failed=0
+        )
     
-    # Create processor
     processor = ParallelExcelProcessor(
-        agent_coordinators=mock_coordinators,
-        ui_update_queue=mock_queue
+        agent_coordinators=[SimpleNamespace(process_question=mock_process_question) for _ in range(3)],
+        ui_update_queue=tracking_queue
     )
-    
-    # Create test workbook
     sheet_data = SheetData(
         sheet_name="Test Sheet",
         sheet_index=0,
-        questions=["Question 1", "Question 2", "Question 3"],
-        answers=[None] * 3,
-        cell_states=[CellState.PENDING] * 3,
+        questions=["Question 1", "Question 2"],
+        answers=[None] * 2,
+        cell_states=[CellState.PENDING] * 2,
         question_col_index=0,
         response_col_index=1
     )
     
-    workbook_data = WorkbookData(
-        file_path="/tmp/test.xlsx",
-        sheets=[sheet_data]
-    )
-    
-    # Process workbook
     result = await processor.process_workbook(
-        workbook_data=workbook_data,
+        workbook_data=WorkbookData(file_path="/tmp/test.xlsx", sheets=[sheet_data]),
         context="Test Context",
         char_limit=100,
         max_retries=3
     )
     
-    # Verify state changes
     assert result.success
-    
-    # Each question should have CELL_WORKING followed by CELL_COMPLETED
-    working_events = [idx for event_type, idx in state_changes if event_type == 'CELL_WORKING']
-    completed_events = [idx for event_type, idx in state_changes if event_type == 'CELL_COMPLETED']
-    
-    assert len(working_events) == 3
-    assert len(completed_events) == 3
-    assert set(working_events) == {0, 1, 2}
-    assert set(completed_events) == {0, 1, 2}
+    working_events = sorted(idx for event_type, idx in state_changes if event_type == 'CELL_WORKING')
+    # One event per agent per question: two agents on each of the two questions
+    assert working_events == [0, 0, 1, 1]
 
 
 if __name__ == "__main__":
@@ -11,102 +11,111 @@ Issue #13: Application analytics shows as blank in Azure AI Foundry.
 Fix: Set OTEL_SERVICE_NAME to "Questionnaire Agent V2" for Application Analytics.
 """
 
-import unittest
 import os
 import sys
-from unittest.mock import patch, MagicMock
-from pathlib import Path
+from unittest.mock import DEFAULT, patch, MagicMock
 
-# Add the parent directory to the path so we can import question_answerer
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
-class TestSingleQuestionTracing(unittest.TestCase):
+
+# One patcher for all the Azure dependencies, built once and entered by each
+# test; it yields the mocks keyed by attribute name
+_PATCH_AZURE = patch.multiple(
+    'question_answerer',
+    AIProjectClient=DEFAULT,
+    DefaultAzureCredential=DEFAULT,
+    configure_azure_monitor=DEFAULT
+)
+
+# Azure settings every tracing test runs with; set once per module
+_TEST_ENV = {
+    "AZURE_OPENAI_ENDPOINT": "https://test.services.ai.azure.com/api/projects/test-project",
+    "AZURE_OPENAI_MODEL_DEPLOYMENT": "gpt-4o-mini",
+    "BING_CONNECTION_ID": "test-bing-connection",
+    "APPLICATIONINSIGHTS_CONNECTION_STRING": "InstrumentationKey=test-key;IngestionEndpoint=https://test.in.applicationinsights.azure.com/"
+}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _azure_env():
+    """Set the test Azure environment once for the whole module."""
+    # Mock environment variables to avoid requiring real Azure credentials during testing
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in _TEST_ENV.items():
+            mp.setenv(name, value)
+        yield
+
+
+@pytest.fixture(scope="module")
+def app_class():
+    """QuestionnaireAgentApp, imported once when the first test runs.
+
+    Imported here rather than at module level because importing
+    question_answerer loads the Azure SDK and configures root logging,
+    which collection alone should not trigger. src is put on sys.path
+    by tests/conftest.py.
+    """
+    from question_answerer import QuestionnaireAgentApp
+
+    return QuestionnaireAgentApp
+
+
+class TestSingleQuestionTracing:
     """Test suite for single question processing with proper tracing setup."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Mock environment variables to avoid requiring real Azure credentials during testing
-        self.env_patches = [
-            patch.dict(os.environ, {
-                "AZURE_OPENAI_ENDPOINT": "https://test.services.ai.azure.com/api/projects/test-project",
-                "AZURE_OPENAI_MODEL_DEPLOYMENT": "gpt-4o-mini",
-                "BING_CONNECTION_ID": "test-bing-connection",
-                "APPLICATIONINSIGHTS_CONNECTION_STRING": "InstrumentationKey=test-key;IngestionEndpoint=https://test.in.applicationinsights.azure.com/"
-            })
-        ]
-        
-        for patch_obj in self.env_patches:
-            patch_obj.start()
+    @pytest.fixture(autouse=True)
+    def _restore_otel_service_name(self):
+        """Undo the OTEL_SERVICE_NAME the application sets, so tests stay independent."""
+        env = os.environ
+        saved = env.get("OTEL_SERVICE_NAME")
+        yield
+        if saved is None:
+            env.pop("OTEL_SERVICE_NAME", None)
+        else:
+            env["OTEL_SERVICE_NAME"] = saved
     
-    def tearDown(self):
-        """Clean up test environment."""
-        for patch_obj in self.env_patches:
-            patch_obj.stop()
-    
-    def test_otel_service_name_is_set(self):
+    def test_otel_service_name_is_set(self, app_class, monkeypatch):
         """Test that OTEL_SERVICE_NAME is properly set for Application Analytics."""
         # Clear any existing OTEL_SERVICE_NAME
-        if "OTEL_SERVICE_NAME" in os.environ:
-            del os.environ["OTEL_SERVICE_NAME"]
+        monkeypatch.delenv("OTEL_SERVICE_NAME", raising=False)
+        
+        # Initialize the application in headless mode
+        with _PATCH_AZURE as mocks:
+            app = app_class()
         
-        # Import and initialize the application
-        from question_answerer import QuestionnaireAgentApp
+        # Verify that OTEL_SERVICE_NAME was set correctly
+        assert os.environ.get("OTEL_SERVICE_NAME") == "Questionnaire Agent V2"
         
-        # Mock Azure dependencies to avoid real connections during testing
-        with patch('question_answerer.AIProjectClient') as mock_client, \
-             patch('question_answerer.DefaultAzureCredential') as mock_credential, \
-             patch('question_answerer.configure_azure_monitor') as mock_configure:
-            
-            # Initialize the application in headless mode
-            app = QuestionnaireAgentApp()
-            
-            # Verify that OTEL_SERVICE_NAME was set correctly
-            self.assertEqual(os.environ.get("OTEL_SERVICE_NAME"), "Questionnaire Agent V2")
-            
-            # Verify Azure Monitor was configured (indicating tracing setup succeeded)
-            mock_configure.assert_called_once()
+        # Verify Azure Monitor was configured (indicating tracing setup succeeded)
+        mocks["configure_azure_monitor"].assert_called_once()
     
-    def test_existing_otel_service_name_preserved(self):
+    def test_existing_otel_service_name_preserved(self, app_class, monkeypatch):
         """Test that existing OTEL_SERVICE_NAME is preserved."""
         # Set a custom service name
         custom_name = "Custom Service Name"
-        os.environ["OTEL_SERVICE_NAME"] = custom_name
+        monkeypatch.setenv("OTEL_SERVICE_NAME", custom_name)
         
-        # Import and initialize the application  
-        from question_answerer import QuestionnaireAgentApp
+        # Initialize the application in headless mode
+        with _PATCH_AZURE:
+            app = app_class()
         
-        # Mock Azure dependencies
-        with patch('question_answerer.AIProjectClient') as mock_client, \
-             patch('question_answerer.DefaultAzureCredential') as mock_credential, \
-             patch('question_answerer.configure_azure_monitor') as mock_configure:
-            
-            # Initialize the application in headless mode
-            app = QuestionnaireAgentApp()
-            
-            # Verify that the existing OTEL_SERVICE_NAME was preserved
-            self.assertEqual(os.environ.get("OTEL_SERVICE_NAME"), custom_name)
+        # Verify that the existing OTEL_SERVICE_NAME was preserved
+        assert os.environ.get("OTEL_SERVICE_NAME") == custom_name
     
-    def test_tracing_initialization_without_connection_string(self):
+    def test_tracing_initialization_without_connection_string(self, app_class, monkeypatch):
         """Test that tracing initialization handles missing connection string gracefully."""
         # Remove the connection string
-        if "APPLICATIONINSIGHTS_CONNECTION_STRING" in os.environ:
-            del os.environ["APPLICATIONINSIGHTS_CONNECTION_STRING"]
+        monkeypatch.delenv("APPLICATIONINSIGHTS_CONNECTION_STRING", raising=False)
+        
+        # Initialize the application in headless mode
+        with _PATCH_AZURE as mocks:
+            app = app_class()
         
-        from question_answerer import QuestionnaireAgentApp
+        # Verify that OTEL_SERVICE_NAME is still set even without Application Insights
+        assert os.environ.get("OTEL_SERVICE_NAME") == "Questionnaire Agent V2"
         
-        # Mock Azure dependencies
-        with patch('question_answerer.AIProjectClient') as mock_client, \
-             patch('question_answerer.DefaultAzureCredential') as mock_credential, \
-             patch('question_answerer.configure_azure_monitor') as mock_configure:
-            
-            # Initialize the application in headless mode
-            app = QuestionnaireAgentApp()
-            
-            # Verify that OTEL_SERVICE_NAME is still set even without Application Insights
-            self.assertEqual(os.environ.get("OTEL_SERVICE_NAME"), "Questionnaire Agent V2")
-            
-            # Verify Azure Monitor was NOT configured due to missing connection string
-            mock_configure.assert_not_called()
+        # Verify Azure Monitor was NOT configured due to missing connection string
+        mocks["configure_azure_monitor"].assert_not_called()
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))
\ No newline at end of file
@@ -2,16 +2,18 @@
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from azure.core.credentials import AccessToken
+from azure.core.credentials import AccessToken, AccessTokenInfo
 from azure.core.exceptions import ClientAuthenticationError
 
 # Add src to path
 import sys
+import threading
+import time
 from pathlib import Path
 src_path = Path(__file__).parent.parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
-from utils.azure_auth import test_authentication as verify_auth, AzureAuthenticator
+from utils.azure_auth import test_authentication as verify_auth, AzureAuthenticator, _CachingTokenCredential
 from utils.exceptions import AuthenticationError
 
 
@@ -200,5 +202,114 @@ class TestAuthenticationErrorMessages:
             assert exc_info.value.__cause__ is original_error
 
 
+
+class TestTokenCaching:
+    """Test that access tokens are reused until they near expiry."""
+    
+    def test_fresh_token_is_reused(self):
+        """Test that a second request for the same scope is served from the cache."""
+        inner = Mock()
+        inner.get_token.return_value = AccessToken(token="valid_token", expires_on=9999999999)
+        credential = _CachingTokenCredential(inner)
+        
+        token1 = credential.get_token("https://management.azure.com/.default")
+        token2 = credential.get_token("https://management.azure.com/.default")
+        
+        assert token1 is token2
+        inner.get_token.assert_called_once()
+    
+    def test_expiring_token_is_refreshed(self):
+        """Test that a token within the refresh margin is fetched again."""
+        inner = Mock()
+        inner.get_token.side_effect = [
+            AccessToken(token="expiring_token", expires_on=int(time.time()) + 60),
+            AccessToken(token="new_token", expires_on=9999999999)
+        ]
+        credential = _CachingTokenCredential(inner)
+        
+        credential.get_token("https://management.azure.com/.default")
+        token = credential.get_token("https://management.azure.com/.default")
+        
+        assert token.token == "new_token"
+        assert inner.get_token.call_count == 2
+    
+    def test_tokens_are_cached_per_scope(self):
+        """Test that different scopes get their own tokens."""
+        inner = Mock()
+        inner.get_token.return_value = AccessToken(token="valid_token", expires_on=9999999999)
+        credential = _CachingTokenCredential(inner)
+        
+        credential.get_token("https://management.azure.com/.default")
+        credential.get_token("https://ai.azure.com/.default")
+        
+        assert inner.get_token.call_count == 2
+    
+    def test_claims_bypass_cache(self):
+        """Test that claims challenges always reach the wrapped credential."""
+        inner = Mock()
+        inner.get_token.return_value = AccessToken(token="valid_token", expires_on=9999999999)
+        credential = _CachingTokenCredential(inner)
+        
+        credential.get_token("https://management.azure.com/.default")
+        credential.get_token("https://management.azure.com/.default", claims="challenge")
+        
+        assert inner.get_token.call_count == 2
+    
+    def test_token_info_is_cached(self):
+        """Test that get_token_info is forwarded and its result reused."""
+        inner = Mock()
+        inner.get_token_info.return_value = AccessTokenInfo("valid_token", 9999999999)
+        credential = _CachingTokenCredential(inner)
+        
+        info1 = credential.get_token_info("https://management.azure.com/.default")
+        info2 = credential.get_token_info("https://management.azure.com/.default")
+        
+        assert info1 is info2
+        inner.get_token_info.assert_called_once_with("https://management.azure.com/.default", options={})
+    
+    def test_token_info_claims_bypass_cache(self):
+        """Test that token info requests with claims always reach the wrapped credential."""
+        inner = Mock()
+        inner.get_token_info.return_value = AccessTokenInfo("valid_token", 9999999999)
+        credential = _CachingTokenCredential(inner)
+        
+        credential.get_token_info("https://management.azure.com/.default")
+        credential.get_token_info("https://management.azure.com/.default", options={"claims": "challenge"})
+        
+        assert inner.get_token_info.call_count == 2
+    
+    def test_context_manager_closes_wrapped_credential(self):
+        """Test that leaving the context closes the wrapped credential."""
+        inner = Mock()
+        
+        with _CachingTokenCredential(inner):
+            pass
+        
+        inner.close.assert_called_once()
+    
+    def test_slow_refresh_does_not_block_other_scopes(self):
+        """Test that a pending fetch for one scope does not hold up another scope."""
+        release = threading.Event()
+        
+        def get_token(*scopes, **kwargs):
+            if scopes == ("https://management.azure.com/.default",):
+                release.wait(5)
+            return AccessToken(token="valid_token", expires_on=9999999999)
+        
+        inner = Mock()
+        inner.get_token.side_effect = get_token
+        credential = _CachingTokenCredential(inner)
+        
+        slow = threading.Thread(target=credential.get_token, args=("https://management.azure.com/.default",))
+        slow.start()
+        try:
+            token = credential.get_token("https://ai.azure.com/.default")
+            assert token.token == "valid_token"
+            assert slow.is_alive()
+        finally:
+            release.set()
+            slow.join()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
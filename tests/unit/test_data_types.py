@@ -4,7 +4,8 @@ import pytest
 from datetime import datetime
 from src.utils.data_types import (
     Question, Answer, AgentStep, DocumentationLink, ProcessingResult,
-    AgentType, ValidationStatus, StepStatus, ProcessingStatus
+    AgentType, ValidationStatus, StepStatus, ProcessingStatus,
+    SheetData, WorkbookData, CellState
 )
 
 
@@ -279,4 +280,37 @@ class TestProcessingResult:
                 success=False,
                 error_message="Test error",
                 processing_time=-1.0
-            )
\ No newline at end of file
+            )
+
+
+class TestSheetData:
+    """Test SheetData progress tracking."""
+    
+    def _sheet(self, count=3):
+        """Build a sheet with count pending questions."""
+        return SheetData(
+            sheet_name="Sheet1",
+            sheet_index=0,
+            questions=[f"Question {i + 1}" for i in range(count)],
+            answers=[None] * count,
+            cell_states=[CellState.PENDING] * count
+        )
+    
+    def test_progress_counts_completed_cells(self):
+        """Test progress and workbook totals reflect completed cells."""
+        sheet = self._sheet()
+        sheet.mark_working(0)
+        sheet.mark_completed(1, "Answer")
+        
+        assert sheet.get_progress() == pytest.approx(1 / 3)
+        assert WorkbookData(file_path="test.xlsx", sheets=[sheet]).completed_questions == 1
+    
+    def test_is_complete_after_last_cell(self):
+        """Test the sheet is complete only once every cell is completed."""
+        sheet = self._sheet(2)
+        sheet.mark_completed(0, "Answer 1")
+        assert not sheet.is_complete
+        
+        sheet.mark_completed(1, "Answer 2")
+        assert sheet.is_complete
+        assert sheet.get_progress() == 1.0
@@ -0,0 +1,112 @@
+"""Unit tests for UIManager single question processing."""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock, patch
+
+# Add src directory to path
+src_path = Path(__file__).parent.parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from utils.data_types import Question, ProcessingResult, Answer, ValidationStatus, AgentInitState
+
+
+@pytest.fixture
+def ui_manager():
+    """Create a UIManager without a display, using the default settings."""
+    from ui.main_window import UIManager
+
+    # Patched on the module so it works whether or not tkinter was imported first
+    with patch('ui.main_window.tk'), patch.object(UIManager, 'setup_ui'):
+        manager = UIManager()
+    manager.context_var = Mock(get=Mock(return_value="Microsoft Azure AI"))
+    manager.char_limit_var = Mock(get=Mock(return_value=2000))
+    manager.max_retries_var = Mock(get=Mock(return_value=10))
+    return manager
+
+
+class TestProcessSingleQuestionAsync:
+    """Test UIManager.process_single_question_async."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("question", ["", "   ", "abc"])
+    async def test_short_question_is_rejected(self, ui_manager, question):
+        """Test that questions under 5 characters raise ValueError."""
+        ui_manager.agent_coordinator = AsyncMock()
+
+        with pytest.raises(ValueError, match="at least 5 characters"):
+            await ui_manager.process_single_question_async(question)
+
+        ui_manager.agent_coordinator.process_question.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_question_is_delegated_to_coordinator(self, ui_manager):
+        """Test that a valid question reaches the agent coordinator with the UI settings."""
+        expected = ProcessingResult(
+            success=True,
+            answer=Answer(content="Azure AI is Microsoft's AI platform.", validation_status=ValidationStatus.APPROVED),
+            processing_time=1.0,
+            questions_processed=1
+        )
+        ui_manager.agent_coordinator = AsyncMock()
+        ui_manager.agent_coordinator.process_question.return_value = expected
+
+        result = await ui_manager.process_single_question_async("What is Azure AI?")
+
+        assert result is expected
+        ui_manager.agent_coordinator.process_question.assert_awaited_once()
+        question = ui_manager.agent_coordinator.process_question.await_args.args[0]
+        assert isinstance(question, Question)
+        assert question.text == "What is Azure AI?"
+        assert question.context == "Microsoft Azure AI"
+        assert question.char_limit == 2000
+        assert question.max_retries == 10
+
+    @pytest.mark.asyncio
+    async def test_agent_init_failure_becomes_failed_result(self, ui_manager):
+        """Test that a failed agent initialization is returned as a failed result."""
+        ui_manager.agent_coordinator = None
+        ui_manager.agent_init_state = AgentInitState.FAILED
+        ui_manager.agent_init_error = "no credentials"
+
+        result = await ui_manager.process_single_question_async("What is Azure AI?")
+
+        assert result.success is False
+        assert "Agent initialization failed" in result.error_message
+        assert "no credentials" in result.error_message
+        assert result.questions_failed == 1
+
+
+class TestProcessSingleQuestion:
+    """Test the synchronous UIManager.process_single_question wrapper."""
+
+    def test_wrapper_runs_async_path(self, ui_manager):
+        """Test that the sync wrapper returns the async path's result."""
+        expected = ProcessingResult(
+            success=True,
+            answer=Answer(content="Azure AI is Microsoft's AI platform.", validation_status=ValidationStatus.APPROVED),
+            processing_time=1.0,
+            questions_processed=1
+        )
+        ui_manager.agent_coordinator = AsyncMock()
+        ui_manager.agent_coordinator.process_question.return_value = expected
+
+        result = ui_manager.process_single_question("What is Azure AI?")
+
+        assert result is expected
+
+    def test_wrapper_propagates_validation_error(self, ui_manager):
+        """Test that the sync wrapper surfaces validation errors."""
+        with pytest.raises(ValueError, match="at least 5 characters"):
+            ui_manager.process_single_question("abc")
+
+    @pytest.mark.asyncio
+    async def test_wrapper_fails_inside_running_loop(self, ui_manager):
+        """Test that the sync wrapper cannot be used from a running event loop."""
+        ui_manager.agent_coordinator = AsyncMock()
+
+        with pytest.raises(RuntimeError, match="process_single_question_async"):
+            ui_manager.process_single_question("What is Azure AI?")
+
+        ui_manager.agent_coordinator.process_question.assert_not_called()